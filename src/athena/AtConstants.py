@@ -24,6 +24,12 @@ DEFAULT_CATEGORY: str = 'Other'
 #: Format pattern for a QtWidgets.QProgressBar widget. It allows to add a custom text but force display of progress.
 PROGRESSBAR_FORMAT: str = '  %p% - {0}'
 
+#: Minimum delay in seconds between two progress value updates of a QtWidgets.QProgressBar widget, limit to ~60 per second.
+PROGRESSBAR_UPDATE_INTERVAL: float = 1.0 / 60.0
+
+#: Minimum delay in seconds between two triggers of the Process user interuption Event, limit to ~60 per second.
+INTERUPTION_LISTEN_INTERVAL: float = 1.0 / 60.0
+
 #: Template for what's expected inside a Blueprint's description.
 BLUEPRINT_TEMPLATE = \
 {
@@ -49,6 +55,7 @@ SETTINGS_TEMPLATE = \
     'checkContextManagers': (),
     'fixContextManagers': (),
     'toolContextManagers': (),
+    'detailedProfiling': False,
 }
 
 #: Default text for Process documentation.
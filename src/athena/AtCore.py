@@ -1,20 +1,20 @@
 from __future__ import annotations
 
 import abc
-import cProfile
+import array
+import collections
 import enum
-import inspect
+import io
 import numbers
 import os
-import pstats
 import re
 import sys
-import tempfile
+import threading
 import time
-from dataclasses import dataclass, field
+import weakref
 from functools import cached_property
-from types import ModuleType, FunctionType
-from typing import TypeVar, Type, Iterator, Callable, Optional, Union, Any, Dict, List, Tuple, Mapping, Sequence
+from types import ModuleType, FunctionType, MappingProxyType
+from typing import TypeVar, Type, Iterable, Iterator, Callable, Optional, Union, Any, Dict, List, Tuple, FrozenSet, Mapping, Sequence, OrderedDict
 
 from athena import AtConstants, AtExceptions, AtStatus, AtUtils
 
@@ -26,6 +26,8 @@ class Event(object):
     Registered callbacks will be invoked when the event is called.
     """
 
+    __slots__ = ('_name', '_callbacks', '_fire')
+
     def __init__(self, name: str) -> None:
         """Initializes an Event with a given name.
 
@@ -34,11 +36,28 @@ class Event(object):
         """
 
         self._name = name
-        self._callbacks = []
+
+        # Callbacks are usually all registered at startup, so they're stored in a tuple that is only rebuilt on
+        # registration and faster to iterate over.
+        self._callbacks: Tuple[Callable, ...] = ()
+
+        # Callable invoked when the event is called, specialized based on the number of registered callbacks.
+        self._fire: Callable = self.__fireNone
 
     def __call__(self, *args, **kwargs) -> None:
         """Invokes all registered callbacks with the provided arguments."""
 
+        self._fire(*args, **kwargs)
+
+    @staticmethod
+    def __fireNone(*args, **kwargs) -> None:
+        """Implementation of the event call when there is no registered callback."""
+
+        pass
+
+    def __fireAll(self, *args, **kwargs) -> None:
+        """Implementation of the event call when there is multiple registered callbacks."""
+
         for callback in self._callbacks:
             callback(*args, **kwargs)
 
@@ -58,11 +77,14 @@ class Event(object):
 
         if not callable(callback):
             AtUtils.LOGGER.warning(
-                'Event "{0}" failed to register callback: Object "{1}" is not callable.'.format(self.name, callback)
+                'Event "{0}" failed to register callback: Object "{1}" is not callable.'.format(self._name, callback)
             )
             return False
 
-        self._callbacks.append(callback)
+        self._callbacks += (callback,)
+
+        # With a single callback, it can be called directly without iterating over the callbacks.
+        self._fire = callback if len(self._callbacks) == 1 else self.__fireAll
 
         return True
 
@@ -87,20 +109,46 @@ class EventSystem(abc.ABC):
     DevModeDisabled = Event('DevModeDisabled')
 
 
-class AtSession(object, metaclass=AtUtils.Singleton):
-    """Singleton class representing the Athena's running session.
+class _AtSession(object):
+    """Class representing the Athena's running session.
 
-    This class provides a single instance that manages the session state,
+    This class must only be instantiated once, as the module level :data:`~SESSION` that manages the session state,
     including a registration system and a development mode toggle.
     
     Example:
-        >>> AtSession().dev = True  # Enable development mode.
+        >>> SESSION.dev = True  # Enable development mode.
     """
 
+    dev: bool
+    """The current state of development mode, setting it to a new value trigger the corresponding events."""
+
     def __init__(self) -> None:
-        """Initialize a new instance of __AtSession."""
+        """Initialize a new instance of _AtSession."""
+
+        # Bypass `__setattr__` so no event is triggered for the default value.
+        object.__setattr__(self, 'dev', False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set the attribute value, if it's the development mode state, trigger corresponding events when it changes.
+
+        Parameters:
+            name: The name of the attribute to set.
+            value: The new value for the attribute.
+        """
+
+        if name != 'dev':
+            object.__setattr__(self, name, value)
+            return
 
-        self._dev: bool = False
+        value = bool(value)
+        if value is self.dev:
+            return
+
+        object.__setattr__(self, name, value)
+        if value:
+            EventSystem.DevModeEnabled()
+        else:
+            EventSystem.DevModeDisabled()
 
     #TODO: Remove this code or update it for blueprint import 2.0
     # @cached_property
@@ -129,57 +177,90 @@ class AtSession(object, metaclass=AtUtils.Singleton):
 
         return Register()
 
-    @property
-    def dev(self) -> bool:
-        """Get the current state of development mode."""
 
-        return self._dev
+#: The Athena's running session, unique for the whole program.
+SESSION: _AtSession = _AtSession()
 
-    @dev.setter
-    def dev(self, value: bool) -> None:
-        """Set the development mode state and trigger corresponding events."""
 
-        self._dev = bool(value)
-        if value:
-            EventSystem.DevModeEnabled()
-        else:
-            EventSystem.DevModeDisabled()
+def AtSession() -> _AtSession:
+    """Get the Athena's running session.
+
+    Return:
+        The unique session instance, :data:`~SESSION`.
+
+    Notes:
+        This is kept for compatibility, prefer accessing :data:`~SESSION` directly.
+    """
+
+    return SESSION
 
 
-#TODO: When Python 3.10 will be more widely used according to vfxplatform, add slots.
-@dataclass(frozen=True)
 class ProtoFeedback(abc.ABC):
-    """Abstract base dataclass for Feedback objects used in Athena.
+    """Abstract base class for Feedback objects used in Athena.
 
     This is the root of all feedback types and only meant to implement common behavior
     between all subclasses.
-    It implement the default attributes and behavior for iteration.
-    """
+    It implement the default attributes and behavior for iteration and comparison.
 
-    feedback: Any
-    """
-    Represents the data held by the feedback instance, which can be of any type based on
-    the specific needs of the associated process.
+    Notes:
+        Feedbacks are created in bulk during a check, they define `__slots__` to keep them as light as possible.
+        Subclasses should also define `__slots__`, at least an empty tuple, to not add a `__dict__` to each instance.
     """
 
-    selectable: bool = field(compare=False)
-    """
-    Determines whether the feedback is selectable. This attribute is not used in comparison,
-    meaning two instances with the same data (:attr:`~ProtoFeedback.feedback`) will be considered
-    similar, regardless of the `selectable` value.
-    """
+    __slots__ = ('feedback', 'selectable', 'children')
 
-    children: List[ProtoFeedback] = field(default_factory=list, init=False, hash=False, compare=False)
-    """
-    Holds references to all child feedback instances. Unlike the feedback itself, this attribute
-    is mutable, and as such, it is not considered in comparison, hashing, or sorting.
-    """
+    def __init__(self, feedback: Any, selectable: bool) -> None:
+        """Initialize a new Feedback with the given data.
+
+        Parameters:
+            feedback: Represents the data held by the feedback instance, which can be of any type based on
+                the specific needs of the associated process.
+            selectable: Determines whether the feedback is selectable. This attribute is not used in comparison,
+                meaning two instances with the same data (:attr:`~ProtoFeedback.feedback`) will be considered
+                similar, regardless of the `selectable` value.
+        """
+
+        self.feedback: Any = feedback
+        self.selectable: bool = selectable
+
+        # Holds references to all child feedback instances. It is not considered in comparison or hashing.
+        self.children: List[ProtoFeedback] = []
+
+    def __repr__(self) -> str:
+        """Representation of the feedback with it's data, selectable state and children."""
+
+        return '{0}(feedback={1!r}, selectable={2!r}, children={3!r})'.format(
+            self.__class__.__qualname__, self.feedback, self.selectable, self.children
+        )
+
+    def __eq__(self, other: Any) -> bool:
+        """Two feedbacks are equal if they are of the same type and hold the same data.
+
+        Parameters:
+            other: The object to compare the feedback with.
+
+        Return:
+            Whether or not both feedbacks are similar.
+        """
+
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self.feedback == other.feedback
+
+    def __hash__(self) -> int:
+        """Make the feedback hashable based on it's data.
+
+        Return:
+            The hash for the feedback's data.
+        """
+
+        return hash((self.feedback,))
 
     def __iter__(self) -> Iterator[Any]:
         """Iterate over all children"""
 
-        for child in self.children:
-            yield child
+        return iter(self.children)
 
     def __str__(self) -> str:
         """Return the string representation of the feedback data."""
@@ -215,8 +296,74 @@ class ProtoFeedback(abc.ABC):
 
         self.children.extend(feedbacks)
 
+    def getSelectableFeedbacks(self) -> List[ProtoFeedback]:
+        """Collect all selectable feedbacks in this feedback's hierarchy.
+
+        Non-selectable feedbacks are considered as groups, they are not collected but their own children are.
+        The hierarchy is walked with an explicit stack, so it can be as deep as needed and allows to do a single
+        batched selection in a software instead of one selection per feedback.
+
+        Return:
+            All selectable feedbacks in the hierarchy, in depth-first order.
+        """
+
+        selectables = []
+
+        stack = self.children[::-1]
+        while stack:
+            feedback = stack.pop()
+            if feedback.selectable:
+                selectables.append(feedback)
+            else:
+                stack.extend(reversed(feedback.children))
+
+        return selectables
+
+    def _cascadeSelect(self, replace: bool) -> bool:
+        """Cascade the selection to all children of this feedback.
+
+        Children that are base :class:`~Feedback` have no selection behavior by themselves, they only cascade to their
+        own children which are then processed in the same loop instead of recursively. All other children are selected
+        with their own `select` implementation.
+
+        Parameters:
+            replace: Whether to replace or add to the current selection.
+
+        Return:
+            The state for the `replace` parameter after the selection, `False` if anything was selected.
+        """
+
+        stack = self.children[::-1]
+        while stack:
+            child = stack.pop()
+            if type(child).select is Feedback.select:
+                if not child.selectable:
+                    stack.extend(reversed(child.children))
+                continue
+
+            child.select(replace=replace)
+            replace = False
+
+        return replace
+
+    def _cascadeDeselect(self) -> None:
+        """Cascade the deselection to all children of this feedback.
+
+        Works the same way as :meth:`~ProtoFeedback._cascadeSelect`, base :class:`~Feedback` are walked through
+        without recursion.
+        """
+
+        stack = self.children[::-1]
+        while stack:
+            child = stack.pop()
+            if type(child).deselect is Feedback.deselect:
+                if not child.selectable:
+                    stack.extend(reversed(child.children))
+                continue
+
+            child.deselect()
+
 
-@dataclass(frozen=True)
 class FeedbackContainer(ProtoFeedback):
     """Base class for Feedback Container containing feedbacks for a specific Thread.
 
@@ -231,11 +378,25 @@ class FeedbackContainer(ProtoFeedback):
         or need to deal with advanced selection/deselection. (= A lot of elements to deal with)
     """
 
-    feedback: Thread
-    """The FeedbackContainer data must be the Thread for which it contain feedbacks."""
+    __slots__ = ('status',)
+
+    def __init__(self, feedback: Thread, selectable: bool, status: AtStatus.Status) -> None:
+        """Initialize a new FeedbackContainer for the given Thread.
+
+        Parameters:
+            feedback: The FeedbackContainer data must be the Thread for which it contain feedbacks.
+            selectable: Whether the FeedbackContainer is selectable.
+            status: The FeedbackContainer status represent the result state of the Thread based on the contained feedbacks.
+        """
+
+        super().__init__(feedback, selectable)
+
+        self.status: AtStatus.Status = status
+
+    def __repr__(self) -> str:
+        """Representation of the container with it's Thread, selectable state, children and status."""
 
-    status: AtStatus.Status
-    """The FeedbackContainer status represent the result state of the Thread based on the contained feedbacks"""
+        return '{0}, status={1!r})'.format(super().__repr__()[:-1], self.status)
 
     def __str__(self) -> str:
         """Simply return the title for the container's Thread"""
@@ -261,11 +422,7 @@ class FeedbackContainer(ProtoFeedback):
         if not self.selectable:
             return replace
             
-        for child in self.children:
-            child.select(replace=replace)
-            replace = False
-
-        return replace
+        return self._cascadeSelect(replace)
 
     def deselect(self) -> None:
         """Allow deselection for the FeedbackContainer.
@@ -277,8 +434,7 @@ class FeedbackContainer(ProtoFeedback):
         if not self.selectable:
             return
 
-        for child in self.children:
-            child.deselect()
+        self._cascadeDeselect()
 
     def setStatus(self, status:AtStatus.Status) -> None:
         """Change the current FeedbackContainer status to the given status.
@@ -287,10 +443,9 @@ class FeedbackContainer(ProtoFeedback):
             status: The new status to set this FeedbackContainer value to.
         """
 
-        object.__setattr__(self, 'status', status)
+        self.status = status
 
 
-@dataclass(frozen=True)
 class Feedback(ProtoFeedback):
     """Base class representing a single found Feedback for Athena.
 
@@ -307,6 +462,8 @@ class Feedback(ProtoFeedback):
         you can implement your own Feedback subclass.
     """
 
+    __slots__ = ()
+
     def select(self, replace:bool = True) -> bool:
         """Allow selection for the Feedback.
 
@@ -324,9 +481,7 @@ class Feedback(ProtoFeedback):
         """
 
         if not self.selectable:
-            for child in self.children:
-                child.select(replace=replace)
-                replace = False
+            replace = self._cascadeSelect(replace)
 
         return replace
 
@@ -344,8 +499,52 @@ class Feedback(ProtoFeedback):
         """
 
         if not self.selectable:
-            for child in self.children:
-                child.deselect()
+            self._cascadeDeselect()
+
+
+class NumericFeedback(Feedback):
+    """Feedback holding many homogeneous numeric ids, like polygons or vertices indices, in a single compact array.
+
+    Processes that find a lot of numeric elements can register them in one NumericFeedback instead of creating one
+    :class:`~Feedback` per element. The ids are stored in an `array.array`, which is a lot lighter than a list of
+    feedbacks.
+
+    Notes:
+        As the ids are mutable, a NumericFeedback is not hashable.
+    """
+
+    __slots__ = ()
+
+    __hash__ = None
+
+    def __init__(self, ids: Iterable[int] = (), selectable: bool = True, typecode: str = 'q') -> None:
+        """Initialize a new NumericFeedback with the given ids.
+
+        Parameters:
+            ids: The numeric ids to store in the feedback.
+            selectable: Whether the feedback is selectable.
+            typecode: The `array.array` typecode used to store the ids, default to signed 64-bit integers.
+        """
+
+        super().__init__(array.array(typecode, ids), selectable)
+
+    def __str__(self) -> str:
+        """Return the number of ids stored in the feedback, as they may be too many to be displayed."""
+
+        return '{0} elements'.format(len(self.feedback))
+
+    def extend(self, ids: Iterable[int]) -> None:
+        """Add the given ids to the feedback.
+
+        Parameters:
+            ids: The numeric ids to add.
+        """
+
+        self.feedback.extend(ids)
+
+
+_OWNED_THREADS: weakref.WeakKeyDictionary[type, Dict[str, Thread]] = weakref.WeakKeyDictionary()
+"""Threads defined on each class, indexed by their attribute name. Filled when the classes are created."""
 
 
 class Thread(object):
@@ -370,9 +569,24 @@ class Thread(object):
         '_failStatus', 
         '_defaultSuccessStatus', 
         '_successStatus',
+        '_statuses',
         '_documentation',
     )
 
+    def __set_name__(self, owner: Type[Process], name: str) -> None:
+        """Register the Thread on the class that own it, so it does not have to be looked up with introspection.
+
+        Parameters:
+            owner: Class object that own the Thread.
+            name: Name of the Thread attribute on the class.
+        """
+
+        ownedThreads = _OWNED_THREADS.get(owner)
+        if ownedThreads is None:
+            ownedThreads = _OWNED_THREADS[owner] = {}
+
+        ownedThreads[name] = self
+
     def __init__(self, title: str, failStatus: AtStatus.FailStatus = AtStatus.ERROR, successStatus: AtStatus.SuccessStatus = AtStatus.SUCCESS, documentation: Optional[str] = None):
         """Initialize an instance of Thread.
 
@@ -408,6 +622,9 @@ class Thread(object):
         self._defaultSuccessStatus = successStatus
         self._successStatus = successStatus
 
+        # Current statuses indexed by the state, to get them without branching.
+        self._statuses: Tuple[AtStatus.FailStatus, AtStatus.SuccessStatus] = (failStatus, successStatus)
+
         self._documentation = documentation
 
     @property
@@ -448,6 +665,7 @@ class Thread(object):
         """
 
         self._failStatus = status
+        self._statuses = (status, self._successStatus)
 
     def overrideSuccessStatus(self, status: AtStatus.SuccessStatus) -> None:
         """Override the actual success status.
@@ -457,6 +675,7 @@ class Thread(object):
         """
 
         self._successStatus = status
+        self._statuses = (self._failStatus, status)
 
     def status(self, state: bool) -> AtStatus.Status:
         """Get the Thread's current status based on given state boolean.
@@ -465,10 +684,7 @@ class Thread(object):
             Success status if `state` is true, fail status otherwise.
         """
 
-        if state:
-            return self._successStatus
-        else:
-            return self._failStatus
+        return self._statuses[bool(state)]
 
 
 #TODO: On a major update, replace individual process computation with process that subscribe to iteration.
@@ -529,6 +745,28 @@ class Process(abc.ABC):
     _listenForUserInteruption: Event = Event('ListenForUserInteruption')
     """Event that allow to notify subscribers when the user is trying to interupt the process execution."""
 
+    __threads: Tuple[Thread, ...] = ()
+    """All threads of the Process class, computed once when the class is created."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Gather the Threads of each new Process subclass so they don't have to be looked up on the class again.
+
+        Threads register themselves on the class that own them when it's created (see :meth:`~Thread.__set_name__`),
+        they only have to be merged through the MRO. A Thread overridden by a subclass member is replaced, the same
+        way attribute access would. Threads are ordered by their attribute name.
+
+        Parameters:
+            **kwargs: Keyword arguments forwarded to the parent implementation.
+        """
+
+        super().__init_subclass__(**kwargs)
+
+        threads = {}
+        for base in reversed(cls.__mro__):
+            threads.update(_OWNED_THREADS.get(base, ()))
+
+        cls.__threads = tuple(thread for name, thread in sorted(threads.items()) if getattr(cls, name, None) is thread)
+
     def __new__(cls, *args: Any, **kwargs: Any) -> Type[Process]:
         """Create a new instance of the Process class.
 
@@ -541,9 +779,17 @@ class Process(abc.ABC):
 
         # Instance internal data (Must not be altered by user)
         instance._feedbackContainer: Dict[Thread, Type[FeedbackContainer]] = cls.__makeFeedbackContainer()
+        instance.__feedbackContainers: Tuple[FeedbackContainer, ...] = tuple(instance._feedbackContainer.values())
         instance.__progressbar: QtWidgets.QProgressBar = None
+        instance.__lastProgressValue: Optional[numbers.Number] = None
+        instance.__lastProgressText: Optional[str] = None
+        instance.__lastProgressUpdate: float = 0.0
+        instance.__pendingProgressValue: Optional[numbers.Number] = None
+        instance.__progressMaximum: Optional[numbers.Number] = None
 
-        instance.__doInterupt: bool = False
+        instance.__interuptionEvent: threading.Event = threading.Event()
+        instance.__isListeningForInteruption: bool = False
+        instance.__lastInteruptionListen: float = 0.0
 
         # Sunder instance attribute (Can be overrided user to custom the process)
         # instance._name_ = cls._name_ or cls.__name__
@@ -578,7 +824,11 @@ class Process(abc.ABC):
             * :const:`~AtStatus._DEFAULT`: The default status used when initializing FeedbackContainers.
         """
 
-        return {thread: cls.FEEDBACK_CONTAINER_CLASS(thread, True, AtStatus._DEFAULT) for thread in cls.threads()}
+        # Threads are computed once when the class is created, use them directly instead of going through `threads`.
+        containerClass = cls.FEEDBACK_CONTAINER_CLASS
+        defaultStatus = AtStatus._DEFAULT
+
+        return {thread: containerClass(thread, True, defaultStatus) for thread in cls.__threads}
 
     @classmethod
     def threads(cls) -> Iterator[Thread]:
@@ -588,9 +838,7 @@ class Process(abc.ABC):
             Each thread instances for the current Process.
         """
 
-        for _, member in inspect.getmembers(cls):
-            if isinstance(member, Thread):
-                yield member
+        return iter(cls.__threads)
 
     def check(self, *args: Any, **kwargs: Any) -> None:
         """This method must be implemented on all Process to register feedbacks and set status for each threads"""
@@ -613,6 +861,13 @@ class Process(abc.ABC):
 
         self.__progressbar = progressBar
 
+        # The last values are cached to not query the widget each time, they're reset for the new progress bar.
+        self.__lastProgressValue = None
+        self.__lastProgressText = None
+        self.__lastProgressUpdate = 0.0
+        self.__pendingProgressValue = None
+        self.__progressMaximum = None if progressBar is None else progressBar.maximum()
+
     def setProgress(self, value: Optional[bool] = None, text: Optional[bool] = None) -> None:
         """Set the progress value and/or text for the associated QProgressBar.
 
@@ -647,11 +902,45 @@ class Process(abc.ABC):
         # this method will define it for the first time, this is why the profiler can detect some more calls for the
         # first call of the first process to be run. --> We talk about insignifiant time but the displayed data will
         # be a bit different. see: https://docs.python.org/2/library/numbers.html
-        if not isinstance(value, numbers.Number):
+        # Values are almost always `int` or `float`, their type is tested first to skip the abstract base class check.
+        valueType = type(value)
+        if valueType is not int and valueType is not float and not isinstance(value, numbers.Number):
             raise TypeError('Argument `value` is not numeric')
         
-        if value and value != self.__progressbar.value():
-            self.__progressbar.setValue(float(value))
+        if not value or value == self.__lastProgressValue:
+            return
+
+        # Limit the number of updates sent to the widget, each of them may trigger a repaint. A value reaching the
+        # progress bar maximum is always sent and a skipped value is kept to be sent by `_flushProgress` once the
+        # execution is over.
+        now = time.monotonic()
+        if value < self.__progressMaximum and now - self.__lastProgressUpdate < AtConstants.PROGRESSBAR_UPDATE_INTERVAL:
+            self.__pendingProgressValue = value
+            return
+
+        self.__progressbar.setValue(float(value))
+        self.__lastProgressValue = value
+        self.__lastProgressUpdate = now
+        self.__pendingProgressValue = None
+
+    def _flushProgress(self) -> None:
+        """Send the last progress value skipped by the throttling of :meth:`~Process.setProgressValue`, if any.
+
+        This is called by the :class:`~Processor` once the Process method returns so the progress bar displays the
+        last value given by the Process even if it was skipped.
+        """
+
+        value = self.__pendingProgressValue
+        if value is None:
+            return
+
+        self.__pendingProgressValue = None
+        if self.__progressbar is None or value == self.__lastProgressValue:
+            return
+
+        self.__progressbar.setValue(float(value))
+        self.__lastProgressValue = value
+        self.__lastProgressUpdate = time.monotonic()
 
     def setProgressText(self, text: str) -> None:
         """Set the label text of the Process progress bar if exist.
@@ -663,19 +952,29 @@ class Process(abc.ABC):
         if self.__progressbar is None:
             return
 
-        if text and text != self.__progressbar.text():
+        if text and text != self.__lastProgressText:
             self.__progressbar.setFormat(AtConstants.PROGRESSBAR_FORMAT.format(text))
+            self.__lastProgressText = text
 
     def clearFeedback(self) -> None:
         """Clear all feedback associated with the threads in the process.
 
-        This method resets the feedback containers for each thread by creating new instances of FeedbackContainers.
-        It effectively clears any previously registered feedback.
+        This method resets the feedback containers for each thread in place, removing their children and setting back
+        their status to :const:`~.AtStatus._DEFAULT`. It effectively clears any previously registered feedback while
+        reusing the same containers from one execution to the other.
+        The cached progress value and text are reset as well, as the UI may have reset the progress bar since the
+        previous execution.
         """
 
-        self._feedbackContainer = self.__makeFeedbackContainer()
+        for container in self.__feedbackContainers:
+            container.children.clear()
+            container.setStatus(AtStatus._DEFAULT)
+
+        self.__lastProgressValue = None
+        self.__lastProgressText = None
+        self.__pendingProgressValue = None
 
-    def hasFeedback(self, thread) -> None:
+    def hasFeedback(self, thread: Thread) -> bool:
         """Check if there is feedback registered for a specific thread.
 
         Parameters:
@@ -728,7 +1027,8 @@ class Process(abc.ABC):
             A tuple containing all feedback containers associated with the threads.
         """
 
-        return tuple(self._feedbackContainer.values())
+        # Containers are reset in place by `clearFeedback`, so the same tuple stays valid for the Process lifetime.
+        return self.__feedbackContainers
 
     def setSuccess(self, thread: Thread) -> None:
         """Set the success status for a specific thread's feedback container.
@@ -737,7 +1037,7 @@ class Process(abc.ABC):
             thread: The thread for which to set the success status.
         """
 
-        self._feedbackContainer[thread].setStatus(thread.status(True))
+        self._feedbackContainer[thread].setStatus(thread._successStatus)
 
     def setFail(self, thread: Thread) -> None:
         """Set the fail status for a specific thread's feedback container.
@@ -746,7 +1046,7 @@ class Process(abc.ABC):
             thread: The thread for which to set the fail status.
         """
 
-        self._feedbackContainer[thread].setStatus(thread.status(False))
+        self._feedbackContainer[thread].setStatus(thread._failStatus)
 
     def setSkipped(self, thread: Thread) -> None:
         """Set the skipped status for a specific thread's feedback container.
@@ -763,8 +1063,8 @@ class Process(abc.ABC):
         This method triggers the :attr:`~Process._listenForUserInteruption` Event, which requires a registered callback
         to invoke the :meth:`~Process._registerInteruption` method from the Qt Application.
 
-        After triggering the event, if there is a callback to invoke the appropriate method, the boolean value
-        for :obj:`~Process.__doInterupt` will be set to True, and an :exc:`.AtExceptions.AtProcessExecutionInterrupted` 
+        After triggering the event, if there is a callback to invoke the appropriate method, the
+        :obj:`~Process.__interuptionEvent` will be set, and an :exc:`.AtExceptions.AtProcessExecutionInterrupted` 
         exception will be raised. This exception can be handle in the Qt Application to force the Process Status to 
         :const:`.AtStatus._ABORTED`.
 
@@ -785,24 +1085,41 @@ class Process(abc.ABC):
             Therefore, the :meth:`~Process._registerInteruption` method needs to be called from the Qt Application to
             toggle the behavior of this method so it can raise. Typically, this method is called in the check or fix 
             method, ensuring that the raise occurs from the main thread.
+
+            As processing the pending events is expensive and this method can be called a lot, the Event is triggered at
+            most once every :const:`.AtConstants.INTERUPTION_LISTEN_INTERVAL` seconds. An interuption registered in the
+            meantime, e.g. from another thread, is raised without triggering the Event.
         """
 
-        if self.__doInterupt:
+        # Do not trigger the Event again if the pending events processing calls this method.
+        if self.__isListeningForInteruption:
             return
 
-        self._listenForUserInteruption()
-
-        if self.__doInterupt:
-            self.__doInterupt = False
+        interuptionEvent = self.__interuptionEvent
+        if not interuptionEvent.is_set():
+            now = time.monotonic()
+            if now - self.__lastInteruptionListen < AtConstants.INTERUPTION_LISTEN_INTERVAL:
+                return
+            self.__lastInteruptionListen = now
+
+            self.__isListeningForInteruption = True
+            try:
+                self._listenForUserInteruption()
+            finally:
+                self.__isListeningForInteruption = False
+
+        if interuptionEvent.is_set():
+            interuptionEvent.clear()
             raise AtExceptions.AtProcessExecutionInterrupted()
 
     def _registerInteruption(self) -> None:
-        """Change the value for the private member :attr:`~Process.__doInterupt` to True.
+        """Set the private member :attr:`~Process.__interuptionEvent`.
         
-        This simply allow to change the value of this private member from outside the class.
+        This simply allow to change the value of this private member from outside the class, it's safe to call from any
+        thread.
         """
 
-        self.__doInterupt = True
+        self.__interuptionEvent.set()
 
 
 class Register(object):
@@ -814,19 +1131,36 @@ class Register(object):
     user's to be able to use for their sanity checking.
     """
 
+    __slots__ = (
+        '__blueprints',
+        '_currentBlueprint',
+        '__blueprintIndexByFile',
+        '__blueprintsByName',
+        '__blueprintsTuple',
+        '__reloadedModulesMTime',
+    )
+
     def __init__(self) -> None:
         """Initialize the Register's internal data."""
         
         self.__blueprints: List[Blueprint, ...] = []
         self._currentBlueprint: Blueprint = None
 
+        # Indexes to find blueprints without iterating over all of them, by module file (same as their equality) and name.
+        self.__blueprintIndexByFile: Dict[str, int] = {}
+        self.__blueprintsByName: Dict[str, Blueprint] = {}
+
+        # Cached immutable copy of the blueprints, reset each time the blueprints are modified.
+        self.__blueprintsTuple: Optional[Tuple[Blueprint, ...]] = None
+
+        # Modification time of each module file when it was last reloaded by the register, by module file.
+        self.__reloadedModulesMTime: Dict[str, int] = {}
+
         EventSystem.RegisterCreated()
 
     def __bool__(self) -> bool:
         """Allow to check if the register is empty or not based on the loaded blueprints."""
-        return bool(self.__blueprint)
-
-    __nonzero__ = __bool__
+        return bool(self.__blueprints)
 
     #FIXME: The import system is not easy to use, find a better way to use them.
     #TODO: Find a way to implement this feature and clean the import process.
@@ -901,17 +1235,32 @@ class Register(object):
         """
 
         newBlueprint = Blueprint(module)
-        for i, blueprint in enumerate(self.__blueprints):
-            if blueprint == newBlueprint:
-                self.__blueprints[i] = newBlueprint
-                break
-        else:
+        file = newBlueprint._moduleFile
+
+        self.__blueprintsTuple = None
+
+        index = self.__blueprintIndexByFile.get(file)
+        if index is None:
+            self.__blueprintIndexByFile[file] = len(self.__blueprints)
             self.__blueprints.append(newBlueprint)
+            self.__blueprintsByName.setdefault(newBlueprint._name, newBlueprint)
+            return
+
+        oldBlueprint = self.__blueprints[index]
+        self.__blueprints[index] = newBlueprint
+
+        # Only the first blueprint loaded for a name can be found by name, keep it if that's not the replaced one.
+        if self.__blueprintsByName.get(oldBlueprint._name) is oldBlueprint:
+            del self.__blueprintsByName[oldBlueprint._name]
+        self.__blueprintsByName.setdefault(newBlueprint._name, newBlueprint)
 
     def clear(self) -> None:
         """Remove all loaded blueprints from this register."""
 
         del self.__blueprints[:]
+        self.__blueprintIndexByFile.clear()
+        self.__blueprintsByName.clear()
+        self.__blueprintsTuple = None
 
     @property
     def blueprints(self) -> Tuple[Blueprint, ...]:
@@ -921,7 +1270,11 @@ class Register(object):
             All blueprints in the current register.
         """
 
-        return tuple(self.__blueprints)
+        blueprints = self.__blueprintsTuple
+        if blueprints is None:
+            self.__blueprintsTuple = blueprints = tuple(self.__blueprints)
+
+        return blueprints
 
     @property
     def currentBlueprint(self) -> Blueprint:
@@ -943,8 +1296,13 @@ class Register(object):
             blueprint: The new Blueprint to set as current blueprint.
         """
 
-        if blueprint in self.__blueprints:
-            self._currentBlueprint = blueprint
+        if not isinstance(blueprint, Blueprint):
+            return
+
+        # Use the registered instance, the given blueprint may be an outdated one based on the same file.
+        index = self.__blueprintIndexByFile.get(blueprint._moduleFile)
+        if index is not None:
+            self._currentBlueprint = self.__blueprints[index]
 
     def blueprintByName(self, name: str) -> Optional[Blueprint]:
         """Get a blueprints from the Register based on it's name.
@@ -958,9 +1316,7 @@ class Register(object):
             The blueprint that match the name, or None if no blueprint match the given name.
         """
 
-        for blueprint in self.__blueprints:
-            if blueprint._name == name:
-                return blueprint
+        return self.__blueprintsByName.get(name)
 
     def reload(self) -> None:
         """Clear the currently loaded blueprints and reload them to ensure all blueprints are up to date.
@@ -968,18 +1324,52 @@ class Register(object):
         This is mostly intended for development usage, as users are not likely to update the Blueprints.
         It's the same are reloading the blueprints, but as they are hold in objects inside a list, they need
         to be rebuilt with the newly loaded instance of the module.
+        Modules whose file did not change since the previous reload are not reloaded again, the blueprints are always
+        rebuilt.
         """
 
         blueprints = self.__blueprints[:]
         self.clear()
 
+        # Process modules are often shared between processors and blueprints, reload each of them only once.
+        processModules = {}
         for blueprint in blueprints:
             for processor in blueprint.processors:
-                AtUtils.reloadModule(processor.module)
-            self.loadBlueprintFromModule(AtUtils.reloadModule(blueprint._module))
+                module = processor.module
+                processModules.setdefault(id(module), module)
+
+        for module in processModules.values():
+            self.__reloadModule(module)
+
+        for blueprint in blueprints:
+            self.loadBlueprintFromModule(self.__reloadModule(blueprint._module))
 
         EventSystem.BlueprintsReloaded()
 
+    def __reloadModule(self, module: ModuleType) -> ModuleType:
+        """Reload the given module, unless it's file did not change since the register last reloaded it.
+
+        Parameters:
+            module: The module to reload.
+
+        Return:
+            The given module, reloaded if needed.
+        """
+
+        file = getattr(module, '__file__', None)
+        try:
+            mTime = os.stat(file).st_mtime_ns
+        except (TypeError, OSError):
+            return AtUtils.reloadModule(module)
+
+        if self.__reloadedModulesMTime.get(file) == mTime:
+            return module
+
+        module = AtUtils.reloadModule(module)
+        self.__reloadedModulesMTime[file] = mTime
+
+        return module
+
 
 #TODO: Maybe make this a subclass of types.ModuleType and wrap class creation.
 class Blueprint(object):
@@ -1003,12 +1393,33 @@ class Blueprint(object):
         other type of data.
     """
 
+    # `__dict__` is kept as it's required by the lazy getters using `functools.cached_property`.
+    __slots__ = (
+        '__dict__',
+        '_module',
+        '_moduleFile',
+        '_hash',
+        '_name',
+        '_processorMap',
+    )
+
     def __init__(self, module: ModuleType) -> None:
         """Initialize the blueprint object by defining it's attributes"""
 
         self._module = module
 
-        self._name: str = os.path.splitext(os.path.basename(module.__file__))[0] or module.__name__
+        # The module file identify the Blueprint, it's interned and hashed once for fast comparisons.
+        self._moduleFile: str = sys.intern(module.__file__)
+        self._hash: int = hash(self._moduleFile)
+
+        # Same as `os.path.splitext(os.path.basename(module.__file__))[0]` but without the generic path handling.
+        baseName = self._moduleFile.rpartition(os.sep)[2]
+        if os.altsep:
+            baseName = baseName.rpartition(os.altsep)[2]
+        dotIndex = baseName.rfind('.')
+        self._name: str = (baseName[:dotIndex] if dotIndex > 0 else baseName) or module.__name__
+
+        self._processorMap: Dict[str, Processor] = {}
 
     def __bool__(self) -> bool:
         """Allow to deteremine if the blueprint contains processors or not.
@@ -1018,8 +1429,6 @@ class Blueprint(object):
         """
         return bool(self.processors)
 
-    __nonzero__ = __bool__
-
     def __hash__(self) -> int:
         """Make the Blueprint hashable based on it's module file path.
 
@@ -1027,7 +1436,7 @@ class Blueprint(object):
             The hash for the blueprint's module file path.
         """
 
-        return hash(self._module.__file__)
+        return self._hash
 
     def __eq__(self, other: Blueprint) -> bool:
         """Support for logical comparison `equal`.
@@ -1040,7 +1449,7 @@ class Blueprint(object):
         if not isinstance(other, Blueprint):
             return False
 
-        return self._module.__file__ == other._module.__file__
+        return self._moduleFile is other._moduleFile
 
     @property
     def name(self) -> str:
@@ -1070,7 +1479,7 @@ class Blueprint(object):
             The blueprint's module file path.
         """
 
-        return os.path.dirname(self._module.__file__)
+        return os.path.dirname(self._moduleFile)
 
     @cached_property    
     def icon(self) -> str:
@@ -1086,6 +1495,22 @@ class Blueprint(object):
         return os.path.join(self.file, '{0}.png'.format(self._name))
 
     @cached_property
+    def _moduleData(self) -> Tuple[Tuple[str, ...], Dict[str, Dict[str, Any]], Dict[str, Any]]:
+        """Lazy getter for the Blueprint's module members, read at once from the module's namespace.
+
+        Return:
+            The values for the `header`, `descriptions` and `settings` attributes in the Blueprint's module.
+        """
+
+        moduleDict = vars(self._module)
+
+        return (
+            moduleDict.get('header', ()),
+            moduleDict.get('descriptions', {}),
+            moduleDict.get('settings', {}),
+        )
+
+    @property
     def header(self) -> Tuple[str, ...]:
         """Lazy getter for the Blueprint's header.
 
@@ -1093,9 +1518,9 @@ class Blueprint(object):
             The value for the `header` attribute in the Blueprint's module or an empty Tuple.
         """
 
-        return getattr(self._module, 'header', ())
+        return self._moduleData[0]
 
-    @cached_property
+    @property
     def descriptions(self) -> Dict[str, Dict[str, Any]]:
         """Lazy getter for the Blueprint's descriptions.
 
@@ -1103,9 +1528,9 @@ class Blueprint(object):
             The value for the `descriptions` attribute in the Blueprint's module or an empty dict.
         """
 
-        return getattr(self._module, 'descriptions', {})
+        return self._moduleData[1]
 
-    @cached_property
+    @property
     def settings(self) -> Dict[str, Any]:
         """Lazy getter for the Blueprint's descriptions.
 
@@ -1113,7 +1538,7 @@ class Blueprint(object):
             The value for the `settings` attribute in the Blueprint's module or an empty dict.
         """
 
-        return getattr(self._module, 'settings', {})
+        return self._moduleData[2]
 
     @cached_property
     def processors(self) -> Tuple[Processor, ...]:
@@ -1126,74 +1551,196 @@ class Blueprint(object):
             A tuple containing all :class:`~Processor` for the current Blueprint's description.
         """
 
-        batchLinkResolve = {}
         processorObjects = []
 
         for id_ in self.header:
-            if id_ not in self.descriptions:
+            processor = self.processor(id_)
+            if processor is None:
                 continue
 
-            processor = Processor(**self.descriptions[id_], settings=self.settings)
-
             processorObjects.append(processor)
-            batchLinkResolve[id_] = processor if processor.inBatch else None
-        
-        # Default resolve for descriptions if available in batch, call the `resolveLinks` method from descriptions to change the targets functions.
-        for processor in processorObjects:
-            processor.resolveLinks(batchLinkResolve, check=AtConstants.CHECK, fix=AtConstants.FIX, tool=AtConstants.TOOL)
 
         return tuple(processorObjects)
 
-    def processorByName(self, name: str) -> Optional[Processor]:
-        """Find a processor from blueprint's processors based on it's name.
-        
+    def processor(self, id_: str) -> Optional[Processor]:
+        """Get the Blueprint's processor for the given id, creating it on demand.
+
+        Only the requested :class:`~Processor` and the ones it is linked to are created, this allows to use a single
+        processor without initializing the whole Blueprint.
+
         Parameters:
-            name: The name of the processor to find.
+            id_: The id of the processor in the Blueprint's header.
 
         Return:
-            The processor that match the name, or None if no processor match the given name.
+            The processor for the given id, or None if the id is not described in the Blueprint's header.
         """
 
-        for processor in self.processors:
-            if processor.moduleName == name:
-                return processor
+        processor = self._processorMap.get(id_)
+        if processor is not None:
+            return processor
 
+        if id_ not in self._headerIds:
+            return None
 
-class Tag(enum.IntFlag):
-    """Tags are modifiers used by athena to affect the way a process behavior. 
-    
-    Tags are defined in the :class:`~Blueprint` and will be parsed by the :class:`~Processor` which will change 
-    it's configuration based on them.
-    The :class:`~Process` by itself is totaly unaware of it's Tags as they are only used by it's wrapper, the Processor.
-    
-    Tags allow Process to be optional, non blocking, hide their checks or even be completely disabled or dependant to
-    another Process using Link.
-    """
+        description = self.descriptions.get(id_)
+        if description is None:
+            return None
 
-    NO_TAG: int = 0
-    """This is used as default, representing the absence of any tag"""
+        self._processorMap[id_] = processor = Processor(**description, settings=self.settings)
 
-    DISABLED: int = enum.auto()
-    """Define if a process should be disabled (by default it is enabled)"""
+        # Default resolve for descriptions if available in batch, call the `resolveLinks` method from descriptions to change the targets functions.
+        # The processor is cached before resolving its links so circular links does not create it again.
+        processor.resolveLinks(self._batchLinkResolve, check=AtConstants.CHECK, fix=AtConstants.FIX, tool=AtConstants.TOOL)
 
-    NO_CHECK: int = enum.auto()
-    """This tag will remove the check of a process, it will force the isCheckable to False in blueprint."""
+        return processor
 
-    NO_FIX: int = enum.auto()
-    """This tag will remove the fix of a process, it will force the isFixable to False in blueprint."""
+    @cached_property
+    def _headerIds(self) -> FrozenSet[str]:
+        """Lazy getter for the ids in the Blueprint's header.
 
-    NO_TOOL: int = enum.auto()
-    """This tag will remove the tool of a process, it will force the hasTool to False in blueprint."""
+        Return:
+            All the ids from the Blueprint's header.
+        """
 
-    NON_BLOCKING: int = enum.auto()
-    """A non blocking process will raise a non blocking error, its error is ignored."""
-    
-    NO_BATCH: int = enum.auto()
-    """This process will only be executed in ui."""
+        return frozenset(self.header)
 
-    NO_UI: int = enum.auto()
-    """This process will only be executed in batch."""
-    
+    @cached_property
+    def _batchLinkResolve(self) -> _BatchLinkResolve:
+        """Lazy getter for the object used to resolve the Blueprint's processors links in batch.
+
+        Return:
+            The mapping of the Blueprint's ids to their processor, or None if the processor is not run in batch.
+        """
+
+        return _BatchLinkResolve(self)
+
+    def processorByName(self, name: str) -> Optional[Processor]:
+        """Find a processor from blueprint's processors based on it's name.
+        
+        Parameters:
+            name: The name of the processor to find.
+
+        Return:
+            The processor that match the name, or None if no processor match the given name.
+        """
+
+        return self._processorsByName.get(name)
+
+    @cached_property
+    def _processorsByName(self) -> Dict[str, Processor]:
+        """Lazy getter for the Blueprint's processors indexed by their module name.
+
+        Return:
+            The Blueprint's processors by name, if multiple processors share a name, the first one is kept.
+        """
+
+        processorsByName = {}
+        for processor in self.processors:
+            processorsByName.setdefault(processor.moduleName, processor)
+
+        return processorsByName
+
+
+class _BatchLinkResolve(Mapping):
+    """Read only mapping of a :class:`~Blueprint`'s ids to their :class:`~Processor`, created on access.
+
+    This is used by the Blueprint to resolve the processors links without having to create all it's processors first.
+    Processors that are not run in batch are resolved to None so their links are skipped.
+    """
+
+    __slots__ = ('_blueprint',)
+
+    def __init__(self, blueprint: Blueprint) -> None:
+        """Initialize the mapping for the given Blueprint.
+
+        Parameters:
+            blueprint: The Blueprint to resolve the processors from.
+        """
+
+        self._blueprint = blueprint
+
+    def __getitem__(self, id_: str) -> Optional[Processor]:
+        """Get the processor for the given id if it is run in batch.
+
+        Parameters:
+            id_: The id of the processor in the Blueprint's header.
+
+        Return:
+            The processor for the given id if it is run in batch, None otherwise.
+        """
+
+        processor = self._blueprint.processor(id_)
+        if processor is None:
+            raise KeyError(id_)
+
+        return processor if processor.inBatch else None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the Blueprint's ids that describe a processor.
+
+        Return:
+            Iterator over the ids of the Blueprint's processors.
+        """
+
+        descriptions = self._blueprint.descriptions
+        return (id_ for id_ in self._blueprint.header if id_ in descriptions)
+
+    def __len__(self) -> int:
+        """Get the number of processors described in the Blueprint.
+
+        Return:
+            The number of ids that describe a processor.
+        """
+
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        """Check if the Blueprint describes at least one processor without counting all of them.
+
+        Return:
+            Whether or not at least one id describe a processor.
+        """
+
+        for _ in self:
+            return True
+        return False
+
+
+class Tag(enum.IntFlag):
+    """Tags are modifiers used by athena to affect the way a process behavior. 
+    
+    Tags are defined in the :class:`~Blueprint` and will be parsed by the :class:`~Processor` which will change 
+    it's configuration based on them.
+    The :class:`~Process` by itself is totaly unaware of it's Tags as they are only used by it's wrapper, the Processor.
+    
+    Tags allow Process to be optional, non blocking, hide their checks or even be completely disabled or dependant to
+    another Process using Link.
+    """
+
+    NO_TAG: int = 0
+    """This is used as default, representing the absence of any tag"""
+
+    DISABLED: int = enum.auto()
+    """Define if a process should be disabled (by default it is enabled)"""
+
+    NO_CHECK: int = enum.auto()
+    """This tag will remove the check of a process, it will force the isCheckable to False in blueprint."""
+
+    NO_FIX: int = enum.auto()
+    """This tag will remove the fix of a process, it will force the isFixable to False in blueprint."""
+
+    NO_TOOL: int = enum.auto()
+    """This tag will remove the tool of a process, it will force the hasTool to False in blueprint."""
+
+    NON_BLOCKING: int = enum.auto()
+    """A non blocking process will raise a non blocking error, its error is ignored."""
+    
+    NO_BATCH: int = enum.auto()
+    """This process will only be executed in ui."""
+
+    NO_UI: int = enum.auto()
+    """This process will only be executed in batch."""
+    
     OPTIONAL: int = NON_BLOCKING | DISABLED
     """This tag will set a check optional, an optional process is not checked by default and will."""
 
@@ -1201,6 +1748,16 @@ class Tag(enum.IntFlag):
     """A dependent process need links to be run through another process."""
 
 
+# Integer values of the Tags used by the Processor, testing them on an `int` avoids the `enum.IntFlag` operators.
+_TAG_DISABLED: int = Tag.DISABLED.value
+_TAG_NO_CHECK: int = Tag.NO_CHECK.value
+_TAG_NO_FIX: int = Tag.NO_FIX.value
+_TAG_NO_TOOL: int = Tag.NO_TOOL.value
+_TAG_NON_BLOCKING: int = Tag.NON_BLOCKING.value
+_TAG_NO_BATCH: int = Tag.NO_BATCH.value
+_TAG_NO_UI: int = Tag.NO_UI.value
+
+
 class Link(enum.Enum):
     """Give access to sentinel objects for each kind of link."""
 
@@ -1214,6 +1771,64 @@ class Link(enum.Enum):
     """Represent the link to or from a Process' tool method"""
 
 
+#: Position of each kind of :class:`~Link` in a Processor's links data.
+_LINK_INDEX: Dict[Link, int] = {Link.CHECK: 0, Link.FIX: 1, Link.TOOL: 2}
+
+#: Bit set in :attr:`~Processor.methodsMask` if the Processor's Process implements a `check` method.
+PROCESSOR_CHECK: int = 1 << 0
+
+#: Bit set in :attr:`~Processor.methodsMask` if the Processor's Process implements a `fix` method.
+PROCESSOR_FIX: int = 1 << 1
+
+#: Bit set in :attr:`~Processor.methodsMask` if the Processor's Process implements a `tool` method.
+PROCESSOR_TOOL: int = 1 << 2
+
+
+_PROCESS_CLASS_DATA: weakref.WeakKeyDictionary[Type[Process], Dict[str, Any]] = weakref.WeakKeyDictionary()
+"""Data computed from each Process class, shared by all the Processors using the same Process class."""
+
+
+def _getProcessClassData(processClass: Type[Process]) -> Dict[str, Any]:
+    """Get the data computed from the given Process class, computing it the first time the class is encountered.
+
+    Parameters:
+        processClass: The Process class to get the data for.
+
+    Return:
+        The Process class' overrided methods, raw name and nice name.
+    """
+
+    classData = _PROCESS_CLASS_DATA.get(processClass)
+    if classData is None:
+        rawName = processClass._name_ or processClass.__name__
+        classData = _PROCESS_CLASS_DATA[processClass] = {
+            'overridedMethods': MappingProxyType(AtUtils.getOverridedMethods(processClass, Process)),
+            'rawName': rawName,
+            'niceName': AtUtils.camelCaseSplit(rawName),
+        }
+
+    return classData
+
+
+_STATUS_OVERRIDE_METHODS: Dict[Type[AtStatus.Status], str] = {
+    AtStatus.FailStatus: 'overrideFailStatus',
+    AtStatus.SuccessStatus: 'overrideSuccessStatus',
+}
+"""Name of the :class:`~Thread` method used to override the Status of each type in a Processor's status overrides."""
+
+
+_DOC_FORMAT_PATTERN: re.Pattern = re.compile(r'\{(\w+)\}')
+"""Pattern matching the format fields in a Process docstring, their value is read from the Process `_docFormat_`."""
+
+
+_EMPTY_DATA: Mapping[str, Any] = MappingProxyType({})
+"""Data shared by all the Processors created without data, replaced by a new dict when data is set on a Processor."""
+
+
+_EMPTY_ARGUMENTS: Tuple[Tuple[()], Mapping[str, Any]] = ((), MappingProxyType({}))
+"""Arguments returned for the Process' methods without arguments, shared to avoid creating new containers per call."""
+
+
 class Processor(object):
     """Proxy object representing a :class:`~Process` configured from a :class:`~Blueprint` description.
 
@@ -1236,6 +1851,35 @@ class Processor(object):
     to the framework's flexibility and ease of use. Whether it's for using them in a UI or batch.
     """
 
+    # `__dict__` is kept as it's required by the lazy getters using `functools.cached_property`.
+    __slots__ = (
+        '__dict__',
+        '_processStrPath',
+        '_processModulePath',
+        '_processClassName',
+        '_moduleName',
+        '_category',
+        '_arguments',
+        '_tags',
+        '_links',
+        '_statusOverrides',
+        '_settings',
+        '__linksData',
+        '__isEnabled',
+        '__isCheckable',
+        '__isFixable',
+        '__hasTool',
+        '__isNonBlocking',
+        '__inUi',
+        '__inBatch',
+        '__methodsMask',
+        '__checkRunner',
+        '__fixRunner',
+        '__toolRunner',
+        '_data',
+        '_processProfile',
+    )
+
     def __init__(self, 
         process: str, 
         category: Optional[str] = None, 
@@ -1262,6 +1906,8 @@ class Processor(object):
         """
 
         self._processStrPath = process
+        self._processModulePath, _, self._processClassName = process.rpartition('.')
+        self._moduleName = self._processModulePath.rpartition('.')[2]
         self._category = category or AtConstants.DEFAULT_CATEGORY
         self._arguments = arguments
         self._tags = tags
@@ -1269,7 +1915,12 @@ class Processor(object):
         self._statusOverrides = statusOverrides
         self._settings = settings or {}
 
-        self.__linksData: Dict[Link, List] = {Link.CHECK: [], Link.FIX: [], Link.TOOL: []}
+        self.__linksData: Tuple[List[Callable], List[Callable], List[Callable]] = ([], [], [])
+
+        # Functions running the Processor's Process methods, built the first time each method is run.
+        self.__checkRunner: Optional[Callable[[bool, bool], Any]] = None
+        self.__fixRunner: Optional[Callable[[bool, bool], Any]] = None
+        self.__toolRunner: Optional[Callable[[bool, bool], Any]] = None
 
         self.__isEnabled: bool = True
 
@@ -1283,8 +1934,16 @@ class Processor(object):
         self.setupTags()
 
         # -- Declare a blueprint internal data, these data are directly retrieved from blueprint's non built-in keys.
-        self._data = dict(**kwargs)
-        self._processProfile: _ProcessProfile = _ProcessProfile()
+        # Most Processors have no data, they share an empty read-only mapping until data is set.
+        self._data = dict(kwargs) if kwargs else _EMPTY_DATA
+        detailedProfiling = self._settings.get('detailedProfiling', AtConstants.SETTINGS_TEMPLATE['detailedProfiling'])
+        self._processProfile: _ProcessProfile = _ProcessProfile(subcalls=detailedProfiling, builtins=detailedProfiling)
+
+        # -- Bind the data accessors directly to the dict methods, this skip a Python call per access.
+        # The methods defined on the class are kept for documentation and as fallback if these are removed.
+        if kwargs:
+            self.getData = self._data.get
+            self.setData = self._data.__setitem__
 
     def __repr__(self) -> str:
         """Readable representation of the Processor object
@@ -1293,17 +1952,17 @@ class Processor(object):
             A readable representation of the Processor based on it's process import path and id.
         """
 
-        return '<{0} `{1}` at {2}>'.format(self.__class__.__name__, self._processStrPath.rpartition('.')[2], hex(id(self)))
+        return '<{0} `{1}` at {2}>'.format(self.__class__.__name__, self._processClassName, hex(id(self)))
 
-    @cached_property
+    @property
     def moduleName(self) -> str:
-        """Lazy getter for the Processor's Process module name.
+        """Getter for the Processor's Process module name.
         
         Return:
             The Processor's Process module name.
         """
 
-        return self._processStrPath.split('.')[-2]
+        return self._moduleName
 
     @cached_property
     def module(self) -> ModuleType:
@@ -1313,7 +1972,7 @@ class Processor(object):
             The Processor's Process module object that was imported.
         """
 
-        return AtUtils.importProcessModuleFromPath(self._processStrPath)
+        return AtUtils.cachedImport(self._processModulePath)
 
     @cached_property
     def processClass(self):
@@ -1323,7 +1982,7 @@ class Processor(object):
             The Processor's Process class
         """
 
-        return getattr(self.module, self._processStrPath.rpartition('.')[2])
+        return AtUtils.cachedImport(self._processModulePath, self._processClassName)
 
     @cached_property
     def process(self) -> Type[Process]:
@@ -1357,14 +2016,14 @@ class Processor(object):
         return tuple(parameters)
 
     @cached_property
-    def overridedMethods(self) -> List[str]:
+    def overridedMethods(self) -> Mapping[str, FunctionType]:
         """Lazy getter for the overrided methods of the Processor's Process class.
 
         Return:
-            List of name for each overrided method on the Processor's Process class compared to :class:`~Process`
+            Each overrided method on the Processor's Process class compared to :class:`~Process`, by name.
         """
 
-        return AtUtils.getOverridedMethods(self.processClass, Process)
+        return _getProcessClassData(self.processClass)['overridedMethods']
 
     @cached_property
     def niceName(self) -> str:
@@ -1374,7 +2033,7 @@ class Processor(object):
             A nice name for the Processor's Process, split if on camelCase.
         """
 
-        return AtUtils.camelCaseSplit(self.rawName)
+        return _getProcessClassData(self.processClass)['niceName']
 
     @cached_property
     def docstring(self) -> str:
@@ -1387,13 +2046,19 @@ class Processor(object):
             The formatted docstring to be more readable and also display the path of the process.
         """
 
-        docstring = self.processClass._doc_ or self.processClass.__doc__ or AtConstants.NO_DOCUMENTATION_AVAILABLE
+        processClass = self.processClass
+
+        docstring = processClass._doc_ or processClass.__doc__ or AtConstants.NO_DOCUMENTATION_AVAILABLE
         docstring += '\n {0} '.format(self._processStrPath)
 
+        # The format values are only looked up when the docstring have fields to format.
         docFormat = {}
-        for match in re.finditer(r'\{(\w+)\}', docstring):
+        processDocFormat = None
+        for match in _DOC_FORMAT_PATTERN.finditer(docstring):
+            if processDocFormat is None:
+                processDocFormat = processClass._docFormat_
             matchStr = match.group(1)
-            docFormat[matchStr] = self.processClass._docFormat_.get(matchStr, '')
+            docFormat[matchStr] = processDocFormat.get(matchStr, '')
 
         return docstring.format(**docFormat)
 
@@ -1435,7 +2100,7 @@ class Processor(object):
             The name for the Processor's Process, this will fallback to the class name if no `_name_` is set.
         """
 
-        return self.processClass._name_ or self.processClass.__name__
+        return _getProcessClassData(self.processClass)['rawName']
 
     @property
     def isEnabled(self) -> bool:
@@ -1455,6 +2120,9 @@ class Processor(object):
             `True` if the Processor is checkable, `False` Otherwise. 
         """
 
+        if self.__methodsMask is None:
+            self._setupMethods()
+
         return self.__isCheckable
 
     @property
@@ -1465,6 +2133,9 @@ class Processor(object):
             `True` if the Processor is fixable, `False` Otherwise.
         """
 
+        if self.__methodsMask is None:
+            self._setupMethods()
+
         return self.__isFixable
 
     @property
@@ -1497,6 +2168,21 @@ class Processor(object):
 
         return self.__isNonBlocking
 
+    @property
+    def methodsMask(self) -> int:
+        """Getter for the mask of the Processor's Process methods that can be run.
+
+        Return:
+            A combination of :data:`~PROCESSOR_CHECK`, :data:`~PROCESSOR_FIX` and :data:`~PROCESSOR_TOOL` for each 
+            method implemented by the Processor's Process. This allows to filter processors with a single `&` test.
+        """
+
+        methodsMask = self.__methodsMask
+        if methodsMask is None:
+            methodsMask = self._setupMethods()
+
+        return methodsMask
+
     @property
     def category(self) -> str:
         """Get the Processor's category.
@@ -1507,7 +2193,7 @@ class Processor(object):
 
         return self._category
 
-    def getArguments(self, method: str) -> Tuple[List[Any], Dict[str, Any]]:
+    def getArguments(self, method: str) -> Tuple[Sequence[Any], Mapping[str, Any]]:
         """Retrieve arguments values for the given method of the Processor's Process.
         
         Parameters:
@@ -1517,17 +2203,17 @@ class Processor(object):
             Tuple containing a list of arguments values and a dict of keyword arguments values.
 
         Notes:
-            This method will not raise any error, if no argument is found, return a tuple containing empty
-            list and empty dict.
+            This method will not raise any error, if no argument is found, return a shared tuple containing an empty
+            tuple and an empty read-only mapping.
         """
 
         arguments = self._arguments
         if arguments is None:
-            return ([], {})
+            return _EMPTY_ARGUMENTS
 
         arguments = arguments.get(method, None)
         if arguments is None:
-            return ([], {})
+            return _EMPTY_ARGUMENTS
 
         return arguments
 
@@ -1576,23 +2262,11 @@ class Processor(object):
             All feedback containers for the Processor's Process post check.
         """
 
-        if not self.hasCheckMethod:
-            return None
-        
-        args, kwargs = self.getArguments(AtConstants.CHECK)
-
-        try:
-            if doProfiling:
-                self._processProfile.profileMethod(self.process.check, *args, **kwargs)
-            else:
-                self.process.check(*args, **kwargs)
-        except Exception as exception:
-            raise
-        finally:
-            if links:
-                self.runLinks(Link.CHECK)
+        runner = self.__checkRunner
+        if runner is None:
+            runner = self.__checkRunner = self.__makeRunner(AtConstants.CHECK, Link.CHECK, PROCESSOR_CHECK)
 
-        return self.process.getFeedbackContainers()
+        return runner(links, doProfiling)
 
     def fix(self, links: bool = True, doProfiling: bool = False) -> Tuple[FeedbackContainer, ...]:
         """This is a wrapper for the Processor's Process `fix`.
@@ -1608,23 +2282,11 @@ class Processor(object):
             All feedback containers for the Processor's Process post fix.
         """
 
-        if not self.hasFixMethod:
-            return None
+        runner = self.__fixRunner
+        if runner is None:
+            runner = self.__fixRunner = self.__makeRunner(AtConstants.FIX, Link.FIX, PROCESSOR_FIX)
 
-        args, kwargs = self.getArguments(AtConstants.FIX)
-
-        try:
-            if doProfiling:
-                self._processProfile.profileMethod(self.process.fix, *args, **kwargs)
-            else:
-                self.process.fix(*args, **kwargs)
-        except Exception:
-            raise
-        finally:
-            if links:
-                self.runLinks(Link.FIX)
-
-        return self.process.getFeedbackContainers()
+        return runner(links, doProfiling)
 
     def tool(self, links: bool = True, doProfiling: bool = False) -> Any:
         """This is a wrapper for the Processor's Process `tool`.
@@ -1641,23 +2303,64 @@ class Processor(object):
             so it can be parented to the UI this Processor's is runt from.
         """
 
-        if not self.hasToolMethod:
-            return None
+        runner = self.__toolRunner
+        if runner is None:
+            runner = self.__toolRunner = self.__makeRunner(AtConstants.TOOL, Link.TOOL, PROCESSOR_TOOL)
 
-        args, kwargs = self.getArguments(AtConstants.TOOL)
+        return runner(links, doProfiling)
 
-        try:
-            if doProfiling:
-                returnValue = self._processProfile.profileMethod(self.process.tool, *args, **kwargs)
-            else:
-                returnValue = self.process.tool(*args, **kwargs)
-        except Exception:
-            raise
-        finally:
-            if links:
-                self.runLinks(Link.TOOL)
+    def __makeRunner(self, methodName: str, link: Link, methodBit: int) -> Callable[[bool, bool], Any]:
+        """Build the function running one of the Processor's Process methods with it's arguments and links.
+
+        Everything that does not change between two runs is resolved once, this is used to implement
+        :meth:`~Processor.check`, :meth:`~Processor.fix` and :meth:`~Processor.tool`. The runners must be built again
+        when the Processor's links are resolved.
 
-        return returnValue
+        Parameters:
+            methodName: The name of the Processor's Process method to run.
+            link: The kind of links to run after the method.
+            methodBit: The bit of the method in the Processor's :attr:`~Processor.methodsMask`.
+
+        Return:
+            A function taking the `links` and `doProfiling` arguments of the wrapper. It returns the Processor's Process
+            feedback containers, or the value returned by the `tool` method.
+        """
+
+        if not self.methodsMask & methodBit:
+            return self.__skipRun
+
+        process = self.process
+        method = getattr(process, methodName)
+        args, kwargs = self.getArguments(methodName)
+        linkedMethods = self.__linksData[_LINK_INDEX[link]]
+        profileMethod = self._processProfile.profileMethod
+        flushProgress = process._flushProgress
+        getFeedbackContainers = None if methodName == AtConstants.TOOL else process.getFeedbackContainers
+
+        def runner(links: bool = True, doProfiling: bool = False) -> Any:
+            try:
+                if doProfiling:
+                    returnValue = profileMethod(method, *args, **kwargs)
+                else:
+                    returnValue = method(*args, **kwargs)
+            finally:
+                flushProgress()
+                if links:
+                    for linkedMethod in linkedMethods:
+                        linkedMethod()
+
+            if getFeedbackContainers is None:
+                return returnValue
+
+            return getFeedbackContainers()
+
+        return runner
+
+    @staticmethod
+    def __skipRun(links: bool = True, doProfiling: bool = False) -> None:
+        """Runner used for the Processor's Process methods that are not implemented, it does nothing."""
+
+        return None
 
     def runLinks(self, which: Link) -> None:
         """Execute the Processor's links for the given :class:`~Link`.
@@ -1666,7 +2369,7 @@ class Processor(object):
             which: Which link we want to run.
         """
 
-        for link in self.__linksData[which]:
+        for link in self.__linksData[_LINK_INDEX[which]]:
             link()
 
     def getParameter(self, parameter: Parameter) -> Any:
@@ -1681,7 +2384,7 @@ class Processor(object):
             class that own the :class:`~Parameter` and the instance for which we want the value.
         """
 
-        return parameter.__get__(self.process, self.processClass)
+        return parameter.getValue(self.process)
 
     def setParameter(self, parameter: Parameter, value: Any) -> Any:
         """Set the given value to the given :class:`~Parameter` object.
@@ -1696,45 +2399,51 @@ class Processor(object):
             class that own the :class:`~Parameter` and the instance for which we want to set the value.
         """
 
-        parameter.__set__(self.process, value)
-        return self.getParameter(parameter)
+        return parameter.setValue(self.process, value)
 
     def setupTags(self) -> None:
-        """Setup the tags used by this Processor to modify the it's behaviour."""
+        """Setup the tags used by this Processor to modify the it's behaviour.
 
-        self.__isEnabled = True
-        self.__isCheckable = self.hasCheckMethod
-        self.__isFixable = self.hasFixMethod
-        self.__hasTool = self.hasToolMethod
-        self.__isNonBlocking = False
-        self.__inBatch = True
-        self.__inUi = True
+        The states that also depend on the Processor's Process implemented methods are resolved lazily by
+        :meth:`~Processor._setupMethods`, so the Process module is not imported when the Processor is created.
+        """
 
-        tags = self._tags
+        self.__methodsMask = None
 
-        if tags is None:
-            return
+        tags = int(self._tags or 0)
+
+        self.__isEnabled = not tags & _TAG_DISABLED
+        self.__isNonBlocking = bool(tags & _TAG_NON_BLOCKING)
+        self.__inBatch = not tags & _TAG_NO_BATCH
+        self.__inUi = not tags & _TAG_NO_UI
 
-        if tags & Tag.DISABLED:
-            self.__isEnabled = False
+    def _setupMethods(self) -> int:
+        """Setup the Processor's states that depend on the Processor's Process implemented methods and tags.
 
-        if tags & Tag.NO_CHECK:
-            self.__isCheckable = False
+        This requires to import the Processor's Process class, it's called the first time one of these states is needed.
 
-        if tags & Tag.NO_FIX:
-            self.__isFixable = False
+        Return:
+            The new mask of the Processor's Process methods that can be run.
+        """
 
-        if tags & Tag.NO_TOOL:
-            self.__hasTool = False
+        # Which of the Processor's Process methods can be run at all, regardless of the tags. Links must still be able
+        # to run the methods of a dependant Processor.
+        hasCheckMethod = self.hasCheckMethod
+        hasFixMethod = self.hasFixMethod
+        hasToolMethod = self.hasToolMethod
+        self.__methodsMask = methodsMask = (
+            (PROCESSOR_CHECK if hasCheckMethod else 0)
+            | (PROCESSOR_FIX if hasFixMethod else 0)
+            | (PROCESSOR_TOOL if hasToolMethod else 0)
+        )
 
-        if tags & Tag.NON_BLOCKING:
-            self.__isNonBlocking = True
+        tags = int(self._tags or 0)
 
-        if tags & Tag.NO_BATCH:
-            self.__inBatch = False
+        self.__isCheckable = hasCheckMethod and not tags & _TAG_NO_CHECK
+        self.__isFixable = hasFixMethod and not tags & _TAG_NO_FIX
+        self.__hasTool = hasToolMethod and not tags & _TAG_NO_TOOL
 
-        if tags & Tag.NO_UI:
-            self.__inUi = False
+        return methodsMask
 
     def resolveLinks(self, 
         linkedObjects: List[Optional[Processor], ...], 
@@ -1753,26 +2462,25 @@ class Processor(object):
             tool: Name of the method to use as tool link on the given objects.
         """
 
-        self.__linksData = linksData = {Link.CHECK: [], Link.FIX: [], Link.TOOL: []}
+        self.__linksData = linksData = ([], [], [])
 
-        if not linkedObjects:
-            return
+        # The runners hold the previous links, they have to be built again.
+        self.__checkRunner = self.__fixRunner = self.__toolRunner = None
 
         links = self._links
-        if links is None:
+        if links is None or not linkedObjects:
             return
 
-        for link in links:
-            id_, _driver, _driven = link
-            if linkedObjects[id_] is None:
-                continue
+        # Resolve the method name for each kind of link once, links are stored as bound methods so running them does
+        # not require any lookup.
+        drivenMethods = {Link.CHECK: check, Link.FIX: fix, Link.TOOL: tool}
 
-            driven = _driven
-            driven = check if _driven is Link.CHECK else driven
-            driven = fix if _driven is Link.FIX else driven
-            driven = tool if _driven is Link.TOOL else driven
+        for id_, driver, driven in links:
+            linkedObject = linkedObjects[id_]
+            if linkedObject is None:
+                continue
 
-            linksData[_driver].append(getattr(linkedObjects[id_], driven))
+            linksData[_LINK_INDEX[driver]].append(getattr(linkedObject, drivenMethods.get(driven, driven)))
 
     def _overrideStatus(self, 
         process: Process, 
@@ -1794,31 +2502,25 @@ class Processor(object):
             return
 
         for threadName, overridesDict in overrides.items():
-            if not hasattr(process, threadName):
-                raise RuntimeError('Process {0} have no thread named {1}.'.format(process._name_, threadName))
-            thread = getattr(process, threadName)
-            
-            # Get the fail overrides for the current name
-            status = overridesDict.get(AtStatus.FailStatus, None)
-            if status is not None:
-                if not isinstance(status, AtStatus.FailStatus):
-                    raise RuntimeError('Fail feedback status override for {0} "{1}" must be an instance or subclass of {2}'.format(
-                        process._name_,
-                        threadName,
-                        AtStatus.FailStatus
-                    ))
-                thread.overrideFailStatus(status)
-            
-            # Get the success overrides for the current name
-            status = overridesDict.get(AtStatus.SuccessStatus, None)
-            if status is not None:
-                if not isinstance(status, AtStatus.SuccessStatus):
-                    raise RuntimeError('Success feedback status override for {0} "{1}" must be an instance or subclass of {2}'.format(
+            try:
+                thread = getattr(process, threadName)
+            except AttributeError:
+                raise RuntimeError('Process {0} have no thread named {1}.'.format(process._name_, threadName)) from None
+
+            # Apply the fail and success overrides for the current name, other keys are ignored.
+            for statusType, status in overridesDict.items():
+                overrideMethodName = _STATUS_OVERRIDE_METHODS.get(statusType)
+                if overrideMethodName is None or status is None:
+                    continue
+
+                if not isinstance(status, statusType):
+                    raise RuntimeError('{0} feedback status override for {1} "{2}" must be an instance or subclass of {3}'.format(
+                        statusType.__name__[:-len('Status')],
                         process._name_,
                         threadName,
-                        AtStatus.SuccessStatus
+                        statusType
                     ))
-                thread.overrideSuccessStatus(status)
+                getattr(thread, overrideMethodName)(status)
 
     def setProgressbar(self, progressbar: QtWidgets.QProgressBar) -> None:
         """Set the ProgressBar object in the UI to be used by the Processor's Process.
@@ -1828,9 +2530,14 @@ class Processor(object):
 
         Parameters:
             progressbar: ProgressBar object object to connect to the process to display check and fix progression.
+
+        Notes:
+            The first call binds the Processor's Process method on the Processor, the next calls go directly to the
+            Process. This is not done at initialisation as it would build the Process.
         """
 
-        self.process.setProgressbar(progressbar)
+        self.setProgressbar = self.process.setProgressbar
+        self.setProgressbar(progressbar)
 
     def getData(self, key: str, default: Optional[Any] = None) -> Any:
         """Get the Processor's Data for the given key or default value if key does not exists.
@@ -1853,7 +2560,23 @@ class Processor(object):
             value: The value to store as data for the given key.
         """
 
-        self._data[key] = value
+        data = self._data
+        if data is _EMPTY_DATA:
+            self._data = data = {}
+            self.getData = data.get
+            self.setData = data.__setitem__
+
+        data[key] = value
+
+    @property
+    def data(self) -> Mapping[str, Any]:
+        """Getter for a read-only view on the Processor's Data.
+
+        Return:
+            A read-only mapping that reflects the Processor's current data.
+        """
+
+        return MappingProxyType(self._data)
 
     def interupt(self):
         """Register user interuption for the Processor's Process"""
@@ -1876,6 +2599,8 @@ class Parameter(abc.ABC):
     correct.
     """
 
+    __slots__ = ('__default', '__value', '__name')
+
     TYPE: Type[T]
     """Represent the type of the Parameter and is used for type casting in the :meth:`~Parameter.typeCast` method"""
 
@@ -1894,7 +2619,7 @@ class Parameter(abc.ABC):
     def __set_name__(self, owner: Type[Process], name: str) -> None:
         """Mangle the name of the Parameter into the class.
         
-        Set a private argument on the class to hold the Parameter's default value.
+        The mangled name is the key used to store the Parameter's value in the `__dict__` of the owner's instances.
 
         Parameters:
             owner: Class object that own the Parameter.
@@ -1902,12 +2627,12 @@ class Parameter(abc.ABC):
         """
 
         self.__name = '__' + name
-        setattr(owner, self.__name, self.__default)
 
     def __get__(self, instance: Optional[Process], owner: Type[Process]) -> T:
         """Descriptor getter for the Parameter value.
 
-        Get the unique Parameter value for the given instance of the owner class.
+        Get the unique Parameter value for the given instance of the owner class, or the Parameter's default value if
+        it was not set for this instance.
         If no instance of the owner class is passed, the Parameter instance is returned
         instead to allow internal manipulation.
         
@@ -1921,7 +2646,9 @@ class Parameter(abc.ABC):
 
         if instance is None:
             return self
-        return getattr(instance, self.__name)
+
+        # Read the instance dict directly, a full attribute lookup would go through the class and it's descriptors.
+        return instance.__dict__.get(self.__name, self.__default)
 
     def __set__(self, instance: Process, value: object) -> None:
         """Descriptor setter for the Parameter value.
@@ -1938,7 +2665,7 @@ class Parameter(abc.ABC):
         castValue = self.typeCast(value)
 
         if self.validate(castValue):
-            setattr(instance, self.__name, castValue)
+            instance.__dict__[self.__name] = castValue
 
     def __delete__(self, instance: Process) -> None:
         """Descriptor deleter for the Parameter.
@@ -1949,7 +2676,43 @@ class Parameter(abc.ABC):
             instance: The instance for which we want reset the Parameter value to default.
         """
 
-        setattr(instance, self.__name, self.__default)
+        instance.__dict__.pop(self.__name, None)
+
+    def getValue(self, instance: Process) -> T:
+        """Get the Parameter value for the given instance of the owner class.
+
+        This is the same as the descriptor getter, without going through the descriptor protocol.
+
+        Parameters:
+            instance: The instance for which we want to get the Parameter value.
+
+        Return:
+            The Parameter's current value for the given instance.
+        """
+
+        return instance.__dict__.get(self.__name, self.__default)
+
+    def setValue(self, instance: Process, value: object) -> T:
+        """Set the Parameter value for the given instance of the owner class.
+
+        This is the same as the descriptor setter, without going through the descriptor protocol.
+
+        Parameters:
+            instance: The instance for which we want to set the Parameter value.
+            value: The new value to set the Parameter's value to.
+
+        Return:
+            The Parameter's current value for the given instance, after being set.
+        """
+
+        castValue = self.typeCast(value)
+
+        instanceDict = instance.__dict__
+        if self.validate(castValue):
+            instanceDict[self.__name] = castValue
+            return castValue
+
+        return instanceDict.get(self.__name, self.__default)
 
     @property
     def name(self) -> str:
@@ -2011,8 +2774,13 @@ class Parameter(abc.ABC):
 class BoolParameter(Parameter):
     """A concrete sub-type of Parameter that can be used to represent a boolean value."""
 
+    __slots__ = ()
+
     TYPE: Type[bool] = bool
 
+    _TRUTHY_VALUES: FrozenSet[Union[bool, str, int]] = frozenset((True, 'True', 'true', 'Yes', 'yes', 'ok', 1, '1'))
+    """All values considered `True` by :meth:`~BoolParameter.typeCast`."""
+
     def __init__(self, default: bool) -> None:
         """Initialize a new instance of BoolParameter.
 
@@ -2043,7 +2811,10 @@ class BoolParameter(Parameter):
             The input value evaluated as a boolean.
         """
 
-        return value in (True, 'True', 'true', 'Yes', 'yes', 1, '1')
+        try:
+            return value in self._TRUTHY_VALUES
+        except TypeError:  # Unhashable values can't be one of the accepted values.
+            return False
 
     def validate(self, value: bool) -> bool:
         """Validate that the given bool is valid.
@@ -2074,6 +2845,8 @@ class _NumberParameter(Parameter):
             * :class:`~FloatParameter`
     """
 
+    __slots__ = ('_minimum', '_maximum', '_keepInRange', '_clamp')
+
     TYPE: Type[numbers.Number] = numbers.Number
 
     def __init__(self, 
@@ -2099,6 +2872,16 @@ class _NumberParameter(Parameter):
         self._maximum = maximum
         self._keepInRange = keepInRange
 
+        # Choose once how the cast values must be kept in range, depending on the limits that are set.
+        self._clamp: Optional[Callable[[numbers.Number], numbers.Number]] = None
+        if keepInRange:
+            if minimum is not None and maximum is not None:
+                self._clamp = lambda value: minimum if value < minimum else maximum if value > maximum else value
+            elif minimum is not None:
+                self._clamp = lambda value: minimum if value < minimum else value
+            elif maximum is not None:
+                self._clamp = lambda value: maximum if value > maximum else value
+
     def typeCast(self, value: object) -> numbers.Number:
         """Cast the input value to the `numbers.Number` type.
         
@@ -2116,13 +2899,11 @@ class _NumberParameter(Parameter):
 
         value = self.TYPE(value)
 
-        if self._keepInRange:
-            if self._minimum is not None and value < self._minimum:
-                return self._minimum
-            elif self._maximum is not None and value > self._maximum:
-                return self._maximum
+        clamp = self._clamp
+        if clamp is None:
+            return value
 
-        return value
+        return clamp(value)
 
     def validate(self, value: numbers.Number) -> bool:
         """Validate if the input numeric value is withing the Parameter's value range.
@@ -2145,18 +2926,24 @@ class _NumberParameter(Parameter):
 class IntParameter(_NumberParameter):
     """A concrete sub-type of Parameter that can be used to represent an integer value."""
 
+    __slots__ = ()
+
     TYPE: Type[int] = int
 
 
 class FloatParameter(_NumberParameter):
     """A concrete sub-type of Parameter that can be used to represent a floating point value."""
 
+    __slots__ = ()
+
     TYPE: Type[float] = float
 
 
 class StringParameter(Parameter):
     """A concrete sub-type of Parameter that can be used to represent a string value."""
 
+    __slots__ = ('_validation', '_caseSensitive', '_validationSet')
+
     TYPE: Type[str] = str
 
     def __init__(self, default: str, validation: Optional[Sequence[str, ...]] = None, caseSensitive: bool = True):
@@ -2176,6 +2963,14 @@ class StringParameter(Parameter):
         self._validation = validation
         self._caseSensitive = caseSensitive
 
+        # The accepted values are lowered once if the validation is not case sensitive.
+        self._validationSet: Optional[FrozenSet[str]] = None
+        if validation is not None:
+            if caseSensitive:
+                self._validationSet = frozenset(validation)
+            else:
+                self._validationSet = frozenset(validation_.lower() for validation_ in validation)
+
     def typeCast(self, value: object) -> str:
         """Cast the input value to string.
 
@@ -2186,7 +2981,7 @@ class StringParameter(Parameter):
             The string representation for the input value.
         """
 
-        return self.TYPE(value.lower())
+        return self.TYPE(value)
 
     def validate(self, value: str) -> bool:
         """Validate if the input value based on the validation if any.
@@ -2198,24 +2993,162 @@ class StringParameter(Parameter):
             Whether or not the input value respect the validation if any, else True.
         """
 
-        if self._validation is None:
+        validationSet = self._validationSet
+        if validationSet is None:
             return True
-        else:
-            if self._caseSensitive:
-                return value in self._validation
-            else:
-                return value.lower() in {validation.lower() for validation in self._validation}
 
-        return False
+        if self._caseSensitive:
+            return value in validationSet
+
+        return value.lower() in validationSet
+
+
+class _MethodProfile(object):
+    """Profiling result for a single method execution, as recorded by :class:`~_ProcessProfile`.
+
+    Only the time at which the profiling was done is computed eagerly, all other data are lazily extracted from the
+    `cProfile.Profile` on first access. This way, profiling a method stays cheap as long as nobody reads its result.
+    Data can be accessed as attributes or with the same keys as a dict for convenience.
+    """
+
+    KEYS: Tuple[str, ...] = ('time', 'calls', 'rawStats', 'tottime', 'ncalls', 'stats')
+
+    def __init__(self, profile: cProfile.Profile) -> None:
+        """Initialise a new method profile from a `cProfile.Profile` that already run.
+
+        Parameters:
+            profile: The profiler used to run the method.
+        """
+
+        self._profile = profile
+
+        # With this we will be able to not re-generate widget (for instance) if data have not been updated.
+        self.time: float = time.time()
+
+    def __getitem__(self, key: str) -> Any:
+        """Give a dict-like access to the profile data.
+
+        Parameters:
+            key: The name of the data to get, must be one of :attr:`~_MethodProfile.KEYS`.
+
+        Return:
+            The profile data for the given key.
+
+        Raise:
+            KeyError: If the key is not a valid profile data.
+        """
+
+        if key not in self.KEYS:
+            raise KeyError(key)
+
+        return getattr(self, key)
+
+    def get(self, key: str, default: Optional[Any] = None) -> Any:
+        """Get the profile data for the given key, or default if key does not exists.
+
+        Parameters:
+            key: The name of the data to get.
+            default: The default value to return in case the key does not exists.
+
+        Return:
+            The profile data for the given key if exists else the default value is returned.
+        """
+
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    @cached_property
+    def stats(self) -> pstats.Stats:
+        """Lazy getter for the `pstats.Stats` of the profiled method, ordered by cumulative time.
+
+        Return:
+            The stats object built from the profiler.
+        """
+
+        import pstats  # Only imported when profiling data are used to reduce Athena's import time.
+
+        stats = pstats.Stats(self._profile)
+        stats.sort_stats('cumulative')  # cumulative will use the `cumtime` to order stats, seems the most relevant.
+
+        return stats
+
+    @cached_property
+    def rawStats(self) -> str:
+        """Lazy getter for the formatted `pstats.Stats` output, ordered by cumulative time.
+
+        Return:
+            The raw stats result as printed by `pstats.Stats.print_stats`.
+        """
+
+        stats = self.stats
+        stats.stream = statStream = io.StringIO()
+        try:
+            stats.print_stats()
+        finally:
+            stats.stream = sys.stdout
+
+        return statStream.getvalue()
+
+    @cached_property
+    def calls(self) -> List[Tuple[str, ...]]:
+        """Lazy getter for each call data, the order of each value is the same than :attr:`~_ProcessProfile.CATEGORIES`.
+
+        Data are directly read from the `pstats.Stats` and formatted the same way `pstats.Stats.print_stats` does.
+
+        Return:
+            A list of tuple where each tuple represent a single function profile data.
+        """
+
+        import pstats
+
+        stats = self.stats
+        dataList = []
+        for function in stats.fcn_list:
+            primitiveCalls, totalCalls, totalTime, cumulativeTime, _ = stats.stats[function]
+
+            ncalls = str(totalCalls) if totalCalls == primitiveCalls else '{0}/{1}'.format(totalCalls, primitiveCalls)
+            dataList.append((
+                ncalls,
+                '{0:.3f}'.format(totalTime),
+                '{0:.3f}'.format(totalTime / totalCalls) if totalCalls else '',
+                '{0:.3f}'.format(cumulativeTime),
+                '{0:.3f}'.format(cumulativeTime / primitiveCalls) if primitiveCalls else '',
+                pstats.func_std_string(function),
+            ))
+
+        return dataList
+
+    @property
+    def tottime(self) -> str:
+        """Getter for the total time spent in the profiled method.
+
+        Return:
+            The total time as displayed in the stats summary.
+        """
+
+        return '{0:.3f}'.format(self.stats.total_tt)
+
+    @property
+    def ncalls(self) -> str:
+        """Getter for the total number of calls during the profiled method execution.
+
+        Return:
+            The number of calls, formatted as `calls/primitive calls` if there are primitive calls.
+        """
+
+        # Take care of possible primitive calls in the summary for `ncalls`.
+        stats = self.stats
+        if stats.total_calls != stats.prim_calls:
+            return '{0}/{1}'.format(stats.total_calls, stats.prim_calls)
+
+        return str(stats.total_calls)
 
 
 class _ProcessProfile(object):
     """Profiler that allow to profile the execution of `athena.AtCore.Process`"""
 
-    # Match integers, floats (comma or dot) and slash in case there is a separation for primitive calls.
-    DIGIT_PATTERN: str = r'([0-9,.\/]+)'
-    DIGIT_REGEX: re.Pattern = re.compile(DIGIT_PATTERN)
-
     CATEGORIES: Tuple[Tuple[str, str], ...] = (
         ('ncalls', 'Number of calls. Multiple numbers (e.g. 3/1) means the function recursed. it reads: Calls / Primitive Calls.'),
         ('tottime', 'Total time spent in the function (excluding time spent in calls to sub-functions).'), 
@@ -2225,9 +3158,22 @@ class _ProcessProfile(object):
         ('filename:lineno(function)', 'Data for each function.')
     )
 
-    def __init__(self) -> None:
-        """Initialiste a Process Profiler and define the default instance attributes."""
-        self._profiles: Dict[str, Dict[str, Union[float, List[Tuple[str, ...], ...]]]] = {} 
+    _MAX_PROFILES: int = 32
+    """Maximum number of profiles kept by the profiler, the least recently updated are discarded first."""
+
+    def __init__(self, subcalls: bool = False, builtins: bool = False) -> None:
+        """Initialiste a Process Profiler and define the default instance attributes.
+
+        Parameters:
+            subcalls: Whether the profiler must record the calls between functions, only needed for a detailed hierarchy.
+            builtins: Whether the profiler must record calls to built-in functions, these are otherwise accounted in their 
+                caller's time.
+        """
+
+        self._profiles: OrderedDict[str, _MethodProfile] = collections.OrderedDict()
+
+        self._subcalls = subcalls
+        self._builtins = builtins
 
     def get(self, key: str, default: Optional[Any] = None) -> Any:
         """Get a profile log from the given key, or default if key does not exists.
@@ -2242,42 +3188,16 @@ class _ProcessProfile(object):
 
         return self._profiles.get(key, default)
 
-    def _getCallDataList(self, callData: Sequence[str, ...]) -> None:
-        """Format and split `cProfile.Profiler` call data list (each value in the list must be one line.)
-
-        This will mostly remove heading or trailing spaces and return a list of tuple where each values in the
-        string is now an entry in the tuple. The order is the same than `athena.AtCore._ProcessProfile.CATEGORIES`.
-        
-        Parameters:
-            callData: Call entries from a `cProfile.Profiler` run.
-        """
-
-        dataList = []
-        for call in callData:
-            callData = []
-
-            filteredData = tuple(filter(lambda x: x, call.strip().split(' ')))
-            if not filteredData:
-                continue
-            callData.extend(filteredData[0:5])
-
-            value = ' '.join(filteredData[5:len(filteredData)])
-            callData.append(float(value) if value.isdigit() else value)
-
-            dataList.append(tuple(callData))
-
-        return dataList
-
     def profileMethod(self, method: FunctionType, *args: Any, **kwargs: Any) -> Any:
         """Profile the given method execution and return it's result. The profiling result will be stored in the 
         object.
 
-        Try to execute the given method with the given args and kwargs and write the result in a temporary file.
-        The result will then be read and each line splited to save a dict in the object `_profiles` attribute using
-        the name of the given method as key.
-        This dict will hold information like the time when the profiling was done (key = `time`, it can allow to not 
+        Try to execute the given method with the given args and kwargs and save a :class:`~_MethodProfile` in the 
+        object `_profiles` attribute using the name of the given method as key.
+        This profile will hold information like the time when the profiling was done (key = `time`, it can allow to not 
         update data in a ui for instance), the total number of calls and obviously a tuple with each call data (`calls`).
-        The raw stats result is also saved under the `rawStats` key if the user want to use it directly.
+        The raw stats result is also available under the `rawStats` key if the user want to use it directly.
+        All data except `time` are only computed when they are accessed.
         
         Parameters:
             method: A callable for which we want to profile the execution and save new data.
@@ -2290,7 +3210,9 @@ class _ProcessProfile(object):
 
         assert callable(method), '`method` must be passed a callable argument.'
 
-        profile = cProfile.Profile()
+        import cProfile  # Only imported when profiling is used to reduce Athena's import time.
+
+        profile = cProfile.Profile(subcalls=self._subcalls, builtins=self._builtins)
 
         # Run the method with `cProfile.Profile.runcall` to profile it's execution only. We define exception before
         # executing it, if an exception occur the except statement will be processed and `exception` will be updated
@@ -2302,53 +3224,39 @@ class _ProcessProfile(object):
         returnValue = None
         try:
             returnValue = profile.runcall(method, *args, **kwargs)
-            self._profiles[method.__name__] = self.getStatsFromProfile(profile)
+            self._storeProfile(method.__name__, self.getStatsFromProfile(profile))
             return returnValue
 
         except Exception as exception_:
-            self._profiles[method.__name__] = self.getStatsFromProfile(profile)
+            self._storeProfile(method.__name__, self.getStatsFromProfile(profile))
             raise
 
-    def getStatsFromProfile(self, profile: cProfile.Profile) -> Dict[str, Union[float, List[Tuple[str, ...], ...]]]:
-        """
+    def _storeProfile(self, key: str, methodProfile: _MethodProfile) -> None:
+        """Store the given method profile at the given key and discard the oldest profiles above the limit.
 
+        Parameters:
+            key: The key to store the profile at, usually the profiled method name.
+            methodProfile: The profile data to store.
         """
 
-        # Create a temp file and use it as a stream for the `pstats.Stats` This will allow us to open the file
-        # and retrieve the stats as a string. With regex it's now possible to retrieve all the data in a displayable format
-        # for any user interface.
-        fd, tmpFile = tempfile.mkstemp()
-        try:
-            with open(tmpFile, 'w') as statStream:
-                stats = pstats.Stats(profile, stream=statStream)
-                stats.sort_stats('cumulative')  # cumulative will use the `cumtime` to order stats, seems the most relevant.
-                stats.print_stats()
-            
-            with open(tmpFile, 'r') as statStream:
-                statsStr = statStream.read()
-        finally:
-            # No matter what happen, we want to delete the file.
-            # It happen that the file is not closed here on Windows so we also call `os.close` to ensure it is really closed.
-            # WindowsError: [Error 32] The process cannot access the file because it is being used by another process: ...
-            os.close(fd)
-            os.remove(tmpFile)
-
-        split = statsStr.split('\n')
-        methodProfile = {
-            'time': time.time(),  # With this we will be able to not re-generate widget (for instance) if data have not been updated.
-            'calls': self._getCallDataList(split[5:-1]),
-            'rawStats': statsStr,
-        }
+        profiles = self._profiles
+        profiles[key] = methodProfile
+        profiles.move_to_end(key)
 
-        # Take care of possible primitive calls in the summary for `ncalls`.
-        summary = self.DIGIT_REGEX.findall(split[0])
-        methodProfile['tottime'] = summary[-1]
-        if len(summary) == 3:
-            methodProfile['ncalls'] = '{0}/{1}'.format(summary[0], summary[1])
-        else:
-            methodProfile['ncalls'] = summary[0]
+        while len(profiles) > self._MAX_PROFILES:
+            profiles.popitem(last=False)
+
+    def getStatsFromProfile(self, profile: cProfile.Profile) -> _MethodProfile:
+        """Wrap the given profile into a :class:`~_MethodProfile` that will lazily extract it's stats.
+
+        Parameters:
+            profile: The profiler used to run a method.
+
+        Return:
+            The profile data for the method that was run with the given profiler.
+        """
 
-        return methodProfile
+        return _MethodProfile(profile)
 
         
 
@@ -1,19 +1,92 @@
 from __future__ import annotations
 
-import abc
 import numbers
-from dataclasses import dataclass, field
+from dataclasses import MISSING, dataclass, field, fields
+from operator import attrgetter
 from typing import Type, Optional, Any, Tuple, Sequence
 
 from athena import AtExceptions
 
 
+_LEVEL = attrgetter('level')
+"""Key function to sort statuses by their level."""
+
 _ALL_STATUS = {}
 """Store all Status that have been created to keep track of them and allow finding lowest/highest"""
 
+_INTERNED_STATUS = {}
+"""Status instances by type and typed field values so declaring the same Status again returns the existing instance."""
+
+_ALL_STATUS_TUPLE = {}
+"""Cache of the tuples of Status returned by each type (`None` for all types), reset when a Status is created."""
+
+_STATUS_BY_NAME = {}
+"""Index of the Status by name built from :func:`~getAllStatus` on lookup, reset when a Status is created."""
+
+_LOWEST_STATUS = {}
+"""Cache of the Status with the lowest level for each Status type, reset when a Status of this type is created."""
+
+_HIGHEST_STATUS = {}
+"""Cache of the Status with the highest level for each Status type, reset when a Status of this type is created."""
+
+
+def _typedValue(value: Any) -> Any:
+    """Pair the given value with it's type, recursively for tuples, so equal values of different types differ.
+
+    Parameters:
+        value: The value to pair with it's type.
+
+    Return:
+        A representation of the value that is only equal to the same value of the same type.
+    """
+
+    if type(value) is tuple:
+        return (tuple, tuple(_typedValue(each) for each in value))
+    return (type(value), value)
+
+
+def _internKey(cls: Type[Status], args: Tuple[Any, ...], kwargs: dict) -> Optional[tuple]:
+    """Build the key used to intern a Status from the arguments it's created with.
+
+    All the dataclass fields are bound, using their default value if they are not given, so two Status created with
+    the same values share the same key whatever the way the arguments are given.
+
+    Parameters:
+        cls: The type of the Status to create.
+        args: The positional arguments given to create the Status.
+        kwargs: The keyword arguments given to create the Status.
+
+    Return:
+        The intern key or None if the Status can't be interned. (e.g. unhashable values or invalid arguments)
+    """
+
+    initFields = [field_ for field_ in fields(cls) if field_.init]
+    if len(args) > len(initFields) or not kwargs.keys() <= {field_.name for field_ in initFields}:
+        return None  # Let the dataclass `__init__` raise the error.
+
+    values = []
+    for i, field_ in enumerate(initFields):
+        if i < len(args):
+            value = args[i]
+        elif field_.name in kwargs:
+            value = kwargs[field_.name]
+        elif field_.default is not MISSING:
+            value = field_.default
+        else:
+            return None  # Missing or factory default, don't intern.
+        values.append(_typedValue(value))
+
+    key = (cls, tuple(values))
+    try:
+        hash(key)
+    except TypeError:  # Unhashable arguments (e.g. a `list` color), the Status can't be interned.
+        return None
+
+    return key
+
 
 @dataclass(frozen=True, order=True)
-class Status(abc.ABC):
+class Status(object):
     """Base `Status` class from which status inherit From.
 
     A Status represent the result state of an Athena's :class:`~Process`, it allows to categorise and prioritise it's 
@@ -24,6 +97,8 @@ class Status(abc.ABC):
     Important:
         Every subclass of status must be `frozen` and `ordered` dataclass so that comparison operator will be implemented
         to sort the different statuses.
+        The Status class itself is abstract and can't be instantiated, this is enforced in `__new__` rather than with
+        `abc.ABC` so `isinstance` checks against statuses don't go through `abc.ABCMeta.__instancecheck__`.
     """
 
     name: str = field(compare=False)
@@ -46,9 +121,26 @@ class Status(abc.ABC):
         if cls is Status:
             raise AtExceptions.AthenaException('{} is abstract an can\'t be instantiated.'.format(cls))
 
+        # Identical statuses share the same instance, the dataclass `__init__` then sets the same values again. The
+        # key holds every field value with it's type, so the values set again are equal and of the same type.
+        key = _internKey(cls, args, kwargs)
+        instance = None if key is None else _INTERNED_STATUS.get(key)
+
+        if instance is not None:
+            return instance
+
         instance = super().__new__(cls)
+        if key is not None:
+            _INTERNED_STATUS[key] = instance
+
         _ALL_STATUS.setdefault(instance.__class__, set()).add(instance)
 
+        _ALL_STATUS_TUPLE.pop(instance.__class__, None)
+        _ALL_STATUS_TUPLE.pop(None, None)
+        _STATUS_BY_NAME.clear()
+        _LOWEST_STATUS.pop(instance.__class__, None)
+        _HIGHEST_STATUS.pop(instance.__class__, None)
+
         return instance
 
     def __repr__(self) -> str:
@@ -138,7 +230,13 @@ def getAllStatus() -> Tuple[Status, ...]:
         Sucess subclass.
     """
 
-    return tuple(status for statusTypeList in _ALL_STATUS.values() for status in statusTypeList)
+    allStatus = _ALL_STATUS_TUPLE.get(None)
+    if allStatus is None:
+        allStatus = _ALL_STATUS_TUPLE[None] = tuple(
+            status for statusTypeList in _ALL_STATUS.values() for status in statusTypeList
+        )
+
+    return allStatus
 
 
 def getStatusByName(name: str) -> Optional[Status]:
@@ -151,11 +249,12 @@ def getStatusByName(name: str) -> Optional[Status]:
         The status that match the name if any, else None.
     """
 
-    for status in getAllStatus():
-        if status.name == name:
-            return status
-    else:
-        return None
+    # The index is built on lookup, the Status name is not set yet when it's created in `__new__`.
+    if not _STATUS_BY_NAME:
+        for status in getAllStatus():
+            _STATUS_BY_NAME.setdefault(status.name, status)
+
+    return _STATUS_BY_NAME.get(name)
 
 
 def getAllFailStatus() -> Tuple[FailStatus, ...]:
@@ -165,7 +264,11 @@ def getAllFailStatus() -> Tuple[FailStatus, ...]:
         All Fail Statuses instances.
     """
 
-    return tuple(_ALL_STATUS[FailStatus])
+    allFailStatus = _ALL_STATUS_TUPLE.get(FailStatus)
+    if allFailStatus is None:
+        allFailStatus = _ALL_STATUS_TUPLE[FailStatus] = tuple(_ALL_STATUS[FailStatus])
+
+    return allFailStatus
 
 
 def getAllSuccessStatus() -> Tuple[SuccessStatus, ...]:
@@ -175,7 +278,11 @@ def getAllSuccessStatus() -> Tuple[SuccessStatus, ...]:
         All Success Statuses instances.
     """
 
-    return tuple(_ALL_STATUS[SuccessStatus])
+    allSuccessStatus = _ALL_STATUS_TUPLE.get(SuccessStatus)
+    if allSuccessStatus is None:
+        allSuccessStatus = _ALL_STATUS_TUPLE[SuccessStatus] = tuple(_ALL_STATUS[SuccessStatus])
+
+    return allSuccessStatus
 
 
 def lowestFailStatus() -> FailStatus:
@@ -185,7 +292,11 @@ def lowestFailStatus() -> FailStatus:
         The Fail Status with the lowest level.
     """
 
-    return sorted(getAllFailStatus(), key=lambda x: x.level)[0]
+    status = _LOWEST_STATUS.get(FailStatus)
+    if status is None:
+        status = _LOWEST_STATUS[FailStatus] = min(_ALL_STATUS[FailStatus], key=_LEVEL)
+
+    return status
 
 
 def highestFailStatus() -> FailStatus:
@@ -195,7 +306,11 @@ def highestFailStatus() -> FailStatus:
         The Fail Status with the highest level.
     """
 
-    return sorted(getAllFailStatus(), key=lambda x: x.level)[-1]
+    status = _HIGHEST_STATUS.get(FailStatus)
+    if status is None:
+        status = _HIGHEST_STATUS[FailStatus] = max(_ALL_STATUS[FailStatus], key=_LEVEL)
+
+    return status
 
 
 def lowestSuccessStatus() -> SuccessStatus:
@@ -205,7 +320,11 @@ def lowestSuccessStatus() -> SuccessStatus:
         The Success Status with the lowest level.
     """
 
-    return sorted(getAllSuccessStatus(), key=lambda x: x.level)[0]
+    status = _LOWEST_STATUS.get(SuccessStatus)
+    if status is None:
+        status = _LOWEST_STATUS[SuccessStatus] = min(_ALL_STATUS[SuccessStatus], key=_LEVEL)
+
+    return status
 
 
 def highestSuccessStatus() -> SuccessStatus:
@@ -215,4 +334,8 @@ def highestSuccessStatus() -> SuccessStatus:
         The Success Status with the highest level.
     """
 
-    return sorted(getAllSuccessStatus(), key=lambda x: x.level)[-1]
+    status = _HIGHEST_STATUS.get(SuccessStatus)
+    if status is None:
+        status = _HIGHEST_STATUS[SuccessStatus] = max(_ALL_STATUS[SuccessStatus], key=_LEVEL)
+
+    return status
@@ -6,7 +6,9 @@ import os
 import pkgutil
 import platform
 import re
+import stat
 import sys
+import time
 import traceback
 
 from collections.abc import Collection, Mapping, Sequence
@@ -24,6 +26,30 @@ from athena import AtConstants
 LOGGER = logging.getLogger(AtConstants.PROGRAM_NAME)
 LOGGER.setLevel(20)
 
+_PATH_STAT_CACHE_TTL: float = 1.0
+"""Duration in seconds during which a path's stat result is considered valid by :func:`~_statMode`."""
+
+_PATH_STAT_CACHE_MAX_SIZE: int = 1024
+"""Number of entries from which expired entries are removed from the caches using :obj:`~_PATH_STAT_CACHE_TTL`."""
+
+_PATH_STAT_CACHE: Dict[str, Tuple[float, Optional[int]]] = {}
+"""Cache of paths to their stat expiry time and mode, or `None` if the path does not exists."""
+
+_LOADER_CACHE: Dict[str, Tuple[float, bool]] = {}
+"""Cache of import strings to their expiry time and whether a loader exists, used by :func:`~importPathStrExist`."""
+
+_PACKAGE_PATTERN: re.Pattern = re.compile(
+    r'.*?'  # Non-greedy match on filler
+    r'({}_(?:[A-Za-z0-9_]+))'  # Match {{PROGRAM_NAME}}_? pattern.
+    r'.*?'  # Non-greedy match on filler
+    r'([A-Za-z0-9_]+)'.format(AtConstants.PROGRAM_NAME),  # Word that match alpha and/or numerics, allowing '_' character.
+    re.IGNORECASE|re.DOTALL
+)
+"""Match module names that contain the tool convention pattern `{PROGRAM_NAME}_*`, used by :func:`~getPackages`."""
+
+_CAMEL_CASE_PATTERN: re.Pattern = re.compile(r'(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])')
+"""Match the empty positions between the words of a camelCase string."""
+
 
 def iterBlueprintsPath(package: str, software: str = 'standalone', verbose: bool = False) -> Iterator[str]:
     """Retrieve available envs from imported packages.
@@ -43,8 +69,17 @@ def iterBlueprintsPath(package: str, software: str = 'standalone', verbose: bool
     """
 
     packagePath = os.path.dirname(package.__file__)
-    for loader, moduleName, _ in pkgutil.iter_modules(package.__path__):
-        yield os.path.join(packagePath, '{}.py'.format(moduleName))
+    with os.scandir(packagePath) as entries:
+        # Only keep importable module names, like `pkgutil.iter_modules` does.
+        modulesPath = [
+            entry.path for entry in entries
+            if entry.name.endswith('.py') and entry.name != '__init__.py' and entry.name[:-3].isidentifier()
+            and entry.is_file()
+        ]
+
+    # Sort to keep the same order as `pkgutil.iter_modules`, this define the blueprints order.
+    modulesPath.sort()
+    yield from modulesPath
 
 
 #WATCME: Not used anymore.
@@ -66,22 +101,13 @@ def getPackages() -> Tuple[str, ...]:
 
     packages = []
 
-    rules = []
-    # Append the rules list with all rules used to get package that end with {PROGRAM_NAME}_?_???
-    rules.append(r'.*?')  # Non-greedy match on filler
-    rules.append(r'({}_(?:[A-Za-z0-9_]+))'.format(AtConstants.PROGRAM_NAME))  # Match {PROGRAM_NAME}_? pattern.
-    rules.append(r'.*?')  # Non-greedy match on filler
-    rules.append(r'([A-Za-z0-9_]+)')  # Word that match alpha and/or numerics, allowing '_' character.
-
-    regex = re.compile(''.join(rules), re.IGNORECASE|re.DOTALL)
+    for loadedPackage in tuple(sys.modules):
 
-    for loadedPackage in sys.modules.keys():
-
-        # Ignore all module unrelated to this tool.
+        # Ignore all module unrelated to this tool, this is way cheaper than the regex for most modules.
         if AtConstants.PROGRAM_NAME not in loadedPackage:
             continue
 
-        search = regex.search(loadedPackage)
+        search = _PACKAGE_PATTERN.search(loadedPackage)
         if not search:
             continue
 
@@ -206,26 +232,23 @@ def pythonImportPathFromPath(path: str) -> str:
         IOError: If the given system path does not exists.
     """
 
-    if not os.path.exists(path):
+    if not _pathExists(path):
         raise IOError('Path `{}` does not exists.'.format(path))
 
     path_, file_ = None, None    
-    if os.path.isfile(path):
+    if _isFile(path):
         path_, _, file_ = path.rpartition(os.sep)
-    elif os.path.isdir(path):
+    elif _isDir(path):
         path_, file_ = path, None
     
-    incrementalPath = ''
+    folders = path_.split(os.sep)
+    incrementalPath = folders[0] or os.sep
     pythonImportPath = ''
-    for i, folder in enumerate(path_.split(os.sep)):
-        if i == 0:
-            incrementalPath = folder or os.sep
-            continue
-        else:
-            incrementalPath += '{}{}'.format(os.sep, folder)
+    for folder in folders[1:]:
+        incrementalPath += os.sep + folder
 
-        if '__init__.py' in os.listdir(incrementalPath):
-            pythonImportPath += '{}{}'.format('.' if pythonImportPath else '', folder)
+        if _hasInit(incrementalPath):
+            pythonImportPath += '.' + folder if pythonImportPath else folder
     
     if file_:
         pythonImportPath += '.' + os.path.splitext(file_)[0]
@@ -233,6 +256,95 @@ def pythonImportPathFromPath(path: str) -> str:
     return pythonImportPath
 
 
+def _hasInit(directory: str) -> bool:
+    """Check if the given directory contains an `__init__.py` module, the result is cached like :func:`~_statMode`.
+
+    Parameters:
+        directory: The directory to check for an `__init__.py` module.
+
+    Return:
+        Whether or not the directory contains an `__init__.py` module.
+    """
+
+    return _isFile(os.path.join(directory, '__init__.py'))
+
+
+def _statMode(path: str) -> Optional[int]:
+    """Get the mode of the given path, the result is cached for :obj:`~_PATH_STAT_CACHE_TTL` seconds.
+
+    Parameters:
+        path: The system path to get the mode of.
+
+    Return:
+        The mode of the given path or `None` if the path does not exists.
+    """
+
+    now = time.monotonic()
+    cached = _PATH_STAT_CACHE.get(path)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    try:
+        mode = os.stat(path).st_mode
+    except (OSError, ValueError):
+        mode = None
+
+    _storeExpiring(_PATH_STAT_CACHE, path, mode, now)
+    return mode
+
+
+def _storeExpiring(cache: Dict[str, Tuple[float, Any]], key: str, value: Any, now: float) -> None:
+    """Store the value in the given cache for :obj:`~_PATH_STAT_CACHE_TTL` seconds.
+
+    Once the cache reaches :obj:`~_PATH_STAT_CACHE_MAX_SIZE` entries, the expired ones are removed, and if it's still
+    full it is cleared, so the paths probed during a session are not kept forever.
+
+    Parameters:
+        cache: The cache to store the value in.
+        key: The key to store the value at.
+        value: The value to store.
+        now: The current monotonic time.
+    """
+
+    if len(cache) >= _PATH_STAT_CACHE_MAX_SIZE:
+        for expiredKey in [key_ for key_, (expiry, _) in cache.items() if expiry <= now]:
+            del cache[expiredKey]
+        if len(cache) >= _PATH_STAT_CACHE_MAX_SIZE:
+            cache.clear()
+
+    cache[key] = (now + _PATH_STAT_CACHE_TTL, value)
+
+
+def _invalidatePath(path: str) -> None:
+    """Remove the given path from the stat cache, this must be called after a path have been created or removed.
+
+    Parameters:
+        path: The system path to invalidate.
+    """
+
+    _PATH_STAT_CACHE.pop(path, None)
+
+
+def _pathExists(path: str) -> bool:
+    """Cached equivalent of :func:`os.path.exists`."""
+
+    return _statMode(path) is not None
+
+
+def _isDir(path: str) -> bool:
+    """Cached equivalent of :func:`os.path.isdir`."""
+
+    mode = _statMode(path)
+    return mode is not None and stat.S_ISDIR(mode)
+
+
+def _isFile(path: str) -> bool:
+    """Cached equivalent of :func:`os.path.isfile`."""
+
+    mode = _statMode(path)
+    return mode is not None and stat.S_ISREG(mode)
+
+
 def importFromStr(moduleStr: str, verbose: bool = False) -> ModuleType:
     """Try to import the module from the given string
 
@@ -242,11 +354,21 @@ def importFromStr(moduleStr: str, verbose: bool = False) -> ModuleType:
 
     Return:
         The loaded Module or None if fail.
+
+    Notes:
+        Modules already imported are returned from `sys.modules` directly, without going through the import system.
     """
 
-    module = None  #Maybe QC Error ?
+    module = sys.modules.get(moduleStr)
+
+    # A module that is still initializing is already in `sys.modules`, importing it makes sure it's fully loaded.
+    if module is not None and not getattr(getattr(module, '__spec__', None), '_initializing', False):
+        if verbose:
+            LOGGER.info('import {} success'.format(moduleStr))
+        return module
+
     try:
-        module = importlib.import_module(moduleStr) #TODO: if multiple checks come from same module try to load module multiple time
+        module = importlib.import_module(moduleStr)
         if verbose: 
             LOGGER.info('import {} success'.format(moduleStr))
     except ImportError as exception:
@@ -258,6 +380,31 @@ def importFromStr(moduleStr: str, verbose: bool = False) -> ModuleType:
     return module
 
 
+def cachedImport(moduleStr: str, name: Optional[str] = None) -> Any:
+    """Get a module, or one of it's members, from `sys.modules` and only import it if it's not already imported.
+
+    Parameters:
+        moduleStr: Python import path of the module.
+        name: Name of a member to get from the module. If None, the module itself is returned.
+
+    Return:
+        The module or the requested member of the module.
+
+    Raises:
+        ImportError: If the module can't be imported or if it does not have a member with the given name.
+    """
+
+    module = importFromStr(moduleStr)
+
+    if name is None:
+        return module
+
+    try:
+        return getattr(module, name)
+    except AttributeError:
+        raise ImportError('Module {0} have no member named {1}'.format(moduleStr, name)) from None
+
+
 def reloadModule(module: ModuleType) -> ModuleType:
     """Reload the given module object using the right `reload` function, whether it's from `imp` or `importLib`.
     
@@ -273,8 +420,11 @@ def reloadModule(module: ModuleType) -> ModuleType:
     Notes:
         This function exists as an helper to simplify Athena's module reloading without having to deal with which reload 
         function to use.
+        This also clear the cache used by :func:`~importPathStrExist` as the reloaded modules may have changed.
     """
 
+    _LOADER_CACHE.clear()
+
     return reload(module)
 
 
@@ -321,9 +471,34 @@ def importPathStrExist(importStr: str) -> bool:
 
     Return:
         Whether or not the given import string is valid and could be imported.
+
+    Notes:
+        The result is cached for each import string during :obj:`~_PATH_STAT_CACHE_TTL` seconds, the cache is also
+        cleared when a module is reloaded with :func:`~reloadModule` or a package is created with
+        :func:`~createNewAthenaPackageHierarchy`.
     """
 
-    return bool(pkgutil.find_loader(importStr))
+    return _hasLoader(importStr)
+
+
+def _hasLoader(importStr: str) -> bool:
+    """Cached implementation of :func:`~importPathStrExist`.
+
+    Parameters:
+        importStr: The python import string path to a module or package.
+
+    Return:
+        Whether or not a loader can be found for the given import string.
+    """
+
+    now = time.monotonic()
+    cached = _LOADER_CACHE.get(importStr)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+
+    hasLoader = bool(pkgutil.find_loader(importStr))
+    _storeExpiring(_LOADER_CACHE, importStr, hasLoader, now)
+    return hasLoader
 
 
 T = TypeVar('T')
@@ -362,17 +537,7 @@ def camelCaseSplit(toSplit: str) -> str:
         The given string camelCase string splitted from upper cases with whitespaces instead.
     """
 
-    matches = re.finditer('(?<=[a-z])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])', toSplit)
-    splitString = []
-
-    previous = 0
-    for match in matches:
-        splitString.append(toSplit[previous:match.start()])
-        previous = match.start()
-
-    splitString.append(toSplit[previous:])
-
-    return ' '.join(splitString)
+    return ' '.join(_CAMEL_CASE_PATTERN.split(toSplit))
 
 
 T = TypeVar('T')
@@ -397,9 +562,12 @@ class Singleton(type):
             the Singleton's design pattern.
         """
 
-        if cls not in cls._instances:
-            cls._instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
-        return cls._instances[cls]
+        instances = cls._instances
+        instance = instances.get(cls)
+        if instance is None:
+            instance = instances[cls] = super(Singleton, cls).__call__(*args, **kwargs)
+
+        return instance
 
     @classmethod
     def __instancecheck__(mcls: Type[T], instance: T) -> bool:
@@ -420,14 +588,17 @@ def createNewAthenaPackageHierarchy(rootDirectory: str) -> None:
     .. deprecated:: 1.0.0
     """
 
-    if os.path.exists(rootDirectory):
+    if _pathExists(rootDirectory):
         raise OSError('`{}` already exists. Abort {0} package creation.'.format(AtConstants.PROGRAM_NAME))
     os.mkdir(rootDirectory)
+    _invalidatePath(rootDirectory)
 
     blueprintDirectory = os.path.join(rootDirectory, 'blueprints')
     os.mkdir(blueprintDirectory)
+    _invalidatePath(blueprintDirectory)
     processesDirectory = os.path.join(rootDirectory, 'processes')
     os.mkdir(processesDirectory)
+    _invalidatePath(processesDirectory)
 
     initPyFiles = (
         os.path.join(rootDirectory, '__init__.py'),
@@ -436,22 +607,125 @@ def createNewAthenaPackageHierarchy(rootDirectory: str) -> None:
         )
     
     header = '# Generated from {0} - Version {1}\n'.format(AtConstants.PROGRAM_NAME, AtConstants.VERSION)
-    for file in initPyFiles:
-        with open(file, 'w') as file:
+    for initPyFile in initPyFiles:
+        with open(initPyFile, 'w') as file:
             file.write(header)
+        _invalidatePath(initPyFile)
 
     dummyProcessPath = os.path.join(processesDirectory, 'dummyProcess.py')
     with open(dummyProcessPath, 'w') as file:
         file.write(header + AtConstants.DUMMY_PROCESS_TEMPLATE)
+    _invalidatePath(dummyProcessPath)
 
     dummyBlueprintPath = os.path.join(blueprintDirectory, 'dummyBlueprint.py')
     with open(dummyBlueprintPath, 'w') as file:
         file.write(header + AtConstants.DUMMY_BLUEPRINT_TEMPLATE)
+    _invalidatePath(dummyBlueprintPath)
+
+    # The new modules may have been looked up before being created.
+    _LOADER_CACHE.clear()
 
 
 T = TypeVar("T")
 R = TypeVar("R")
 
+_LEAF, _MAPPING, _SEQUENCE = 0, 1, 2
+
+_COLLECTION_KINDS: Dict[type, int] = {
+    dict: _MAPPING,
+    list: _SEQUENCE,
+    tuple: _SEQUENCE,
+    str: _LEAF,
+    int: _LEAF,
+    float: _LEAF,
+    bool: _LEAF,
+    type(None): _LEAF,
+}
+"""Cache of types to the way :func:`~_mapCollection` must handle their instances, filled on demand for other types."""
+
+
+def _collectionKind(value: Any) -> int:
+    """Get the kind of collection the given value is, the result is cached by the value's type.
+
+    Parameters:
+        value: The value to get the collection kind of.
+
+    Return:
+        `_MAPPING` for a Mapping, `_SEQUENCE` for a Sequence or `_LEAF` for anything else, including `str`.
+    """
+
+    type_ = type(value)
+    kind = _COLLECTION_KINDS.get(type_)
+    if kind is None:
+        if isinstance(value, Mapping):
+            kind = _MAPPING
+        # `str` is a Sequence of `str`, it must be treated as a leaf to prevent infinite iteration.
+        elif isinstance(value, str):
+            kind = _LEAF
+        elif isinstance(value, Sequence):
+            kind = _SEQUENCE
+        else:
+            kind = _LEAF
+        _COLLECTION_KINDS[type_] = kind
+
+    return kind
+
+
+def _mapCollection(function: Callable[[T], R], collection: Collection[T], kind: int) -> Collection[R]:
+    """Execute the given function on all values inside the given collection without recursion.
+
+    Sub-collections are pushed on an explicit stack and rebuilt with their original type once all their values
+    have been mapped, this avoid the python frames overhead and the recursion limit on deeply nested data.
+
+    Parameters:
+        function: The function to call for each value and sub-value of the given collection.
+        collection: The collection to iterate on and execute the function for each of it's values.
+        kind: The kind of the given collection, either `_MAPPING` or `_SEQUENCE`.
+
+    Return:
+        Equivalent of the input collection with all values and sub-values modified through the given function.
+    """
+
+    def newFrame(source, kind, key):
+        if kind == _MAPPING:
+            return (source, iter(source.items()), {}, key)
+        return (source, iter(source), [], key)
+
+    stack = [newFrame(collection, kind, None)]
+    while True:
+        source, iterator, result, key = stack[-1]
+        isMapping = type(result) is dict
+
+        for item in iterator:
+            if isMapping:
+                itemKey, value = item
+            else:
+                itemKey, value = None, item
+
+            valueKind = _collectionKind(value)
+            if valueKind:
+                # Map the sub-collection first, this frame will resume from the next item.
+                stack.append(newFrame(value, valueKind, itemKey))
+                break
+
+            if isMapping:
+                result[itemKey] = function(value)
+            else:
+                result.append(function(value))
+
+        else:
+            stack.pop()
+            mapped = type(source)(result)
+            if not stack:
+                return mapped
+
+            parentResult = stack[-1][2]
+            if type(parentResult) is dict:
+                parentResult[key] = mapped
+            else:
+                parentResult.append(mapped)
+
+
 def mapMapping(function: Callable[[T], R], mapping: Mapping[T]) -> Mapping[R]:
     """Execute the given function on all values inside the given Mapping object.
 
@@ -463,19 +737,10 @@ def mapMapping(function: Callable[[T], R], mapping: Mapping[T]) -> Mapping[R]:
         Equivalent of the input mapping with all values and sub-values modified through the given function.
 
     Notes:
-        This method will iterate recursively on the mapping and it's values from top to bottom.
+        This method will iterate on the mapping and it's values from top to bottom.
     """
 
-    newMapping = {}
-    for key, value in mapping.items():
-        if isinstance(value, Mapping):
-            newMapping[key] = mapMapping(function, value)
-        elif isinstance(value, Sequence):
-            newMapping[key] = mapSequence(function, value)
-        else:
-            newMapping[key] = function(value)
-    
-    return type(mapping)(newMapping)
+    return _mapCollection(function, mapping, _MAPPING)
           
 
 def mapSequence(function: Callable[[T], R], sequence: Sequence[T]) -> Sequence[R]:
@@ -490,28 +755,19 @@ def mapSequence(function: Callable[[T], R], sequence: Sequence[T]) -> Sequence[R
 
     Notes:
         
-        * This method will iterate recursively on the sequence and it's values from top to bottom.
+        * This method will iterate on the sequence and it's values from top to bottom.
         * As `str` is technically a sub-type of `Sequence`, the first step is to do an instance check and early return if 
           the `sequence` is a string. The function will still be called with this string though and the result value returned
           like it would be for any other type.
     """
 
     # `str` in python is a sequence, but substring are also `str`.
-    # This is meant to prevent RecursionError to occur as even the
+    # This is meant to prevent infinite iteration as even the
     # shortest substring is a `str` and so is a `Sequence` by itself.
     if isinstance(sequence, str):
         return function(sequence)
 
-    newSequence = []
-    for each in sequence:
-        if isinstance(each, Sequence):
-            newSequence.append(mapSequence(function, each))
-        elif isinstance(each, Mapping):
-            newSequence.append(mapMapping(function, each))
-        else:
-            newSequence.append(function(each))
-    
-    return type(sequence)(newSequence)
+    return _mapCollection(function, sequence, _SEQUENCE)
 
 
 def deepMap(function: Callable[[T], R], collection: Collection[T]) -> Collection[R]:
@@ -529,7 +785,7 @@ def deepMap(function: Callable[[T], R], collection: Collection[T]) -> Collection
         Equivalent of the input collection with all values and sub-values modified through the given function.
 
     Notes:
-        This method will iterate recursively on the collection and it's values from top to bottom.
+        This method will iterate on the collection and it's values from top to bottom.
     """
 
     if not isinstance(collection, Collection):
@@ -3,7 +3,6 @@ from __future__ import annotations
 from typing import Type, Union, Iterable
 
 import sys
-from dataclasses import dataclass
 
 from athena import AtCore
 
@@ -126,7 +125,6 @@ def getDisplay(object_: Union[str, OpenMaya.MObject, OpenMaya.MDagPath, OpenMaya
         return object_.name()
 
 
-@dataclass(frozen=True)
 class MayaFeedbackContainer(AtCore.FeedbackContainer):
     """Maya specific :class:`~FeedbackContainer` that implement optimized selection and deselection.
 
@@ -135,6 +133,8 @@ class MayaFeedbackContainer(AtCore.FeedbackContainer):
     especially when there's a lot of feedback to selection.
     """
 
+    __slots__ = ()
+
     def select(self, replace:bool = True) -> bool:
         """Implement Maya's in-scene selection of the current :class:`~MayaFeedbackContainer`.
 
@@ -154,8 +154,9 @@ class MayaFeedbackContainer(AtCore.FeedbackContainer):
             return replace
         
         # with PauseViewport():
-        if self.children:
-            selectInMaya(tuple(child.feedback for child in self.children), mode='add', replace=replace)
+        feedbacks = self.getSelectableFeedbacks()
+        if feedbacks:
+            selectInMaya(tuple(feedback.feedback for feedback in feedbacks), mode='add', replace=replace)
             replace = False
 
         return replace
@@ -172,11 +173,11 @@ class MayaFeedbackContainer(AtCore.FeedbackContainer):
             return
         
         # with PauseViewport():
-        if self.children:
-            selectInMaya(tuple(child.feedback for child in self.children), mode='remove', replace=False)
+        feedbacks = self.getSelectableFeedbacks()
+        if feedbacks:
+            selectInMaya(tuple(feedback.feedback for feedback in feedbacks), mode='remove', replace=False)
 
 
-@dataclass(frozen=True)
 class MayaFeedback(AtCore.Feedback):
     """Represent a single Maya Feedback, this allows for better display and selection/deselection behavior.
 
@@ -185,6 +186,8 @@ class MayaFeedback(AtCore.Feedback):
     display for complexes Maya API types.
     """
 
+    __slots__ = ()
+
     def __str__(self) -> str:
         """Clean display name for the feedback, whether it's already a string (`maya.cmds`) or a Maya API type.
         